@@ -1,17 +1,46 @@
 import asyncio
+import os
 import sys
 from typing import Optional, List
 import click
 from utilities import LoggingConfigurator
 
-from binance_syncer.constant import MarketType, DataType, KlineInterval
+from binance_syncer.constant import (
+    KLINE_DATA_TYPES, MARKET_BY_VALUE, DATA_TYPE_BY_VALUE, INTERVAL_BY_VALUE,
+    MARKET_TYPE_VALUES, DATA_TYPE_VALUES, INTERVAL_VALUES
+)
 from binance_syncer.syncer import Syncer
 
+try:
+    # Optional faster event loop, see the "uvloop" extra
+    import uvloop
+except ImportError:
+    uvloop = None
+
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _ssl_diagnostic() -> None:
+    """Log the CA bundle in use and try an SSL connection to the Binance bucket host."""
+    import ssl
+    import certifi
+    import urllib.request
+
+    logger.info("=== SSL Diagnostic ===")
+    logger.info(f"Certifi path: {certifi.where()}")
+    logger.info(f"SSL default paths: {ssl.get_default_verify_paths()}")
+
+    # Test de connexion SSL basique
+    try:
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        with urllib.request.urlopen('https://s3-ap-northeast-1.amazonaws.com', context=ssl_context, timeout=5) as _:
+            logger.info("✅ SSL test connection successful")
+    except Exception as ssl_error:
+        logger.info(f"SSL test failed: {ssl_error}")
+
+
 async def run_sync(
     market_type: str,
     data_type: str,
@@ -23,27 +52,24 @@ async def run_sync(
 ) -> None:
     """Run the synchronization with the provided arguments."""
     # Convert string enums to enum objects
-    try:
-        market_type_enum = MarketType(market_type)
-    except ValueError:
+    market_type_enum = MARKET_BY_VALUE.get(market_type)
+    if market_type_enum is None:
         click.echo(f"Error: Invalid market type: {market_type}", err=True)
         sys.exit(1)
 
-    try:
-        data_type_enum = DataType(data_type)
-    except ValueError:
+    data_type_enum = DATA_TYPE_BY_VALUE.get(data_type)
+    if data_type_enum is None:
         click.echo(f"Error: Invalid data type: {data_type}", err=True)
         sys.exit(1)
 
     # Validate interval for klines
     interval_enum = None
-    if data_type == "klines" or "klines" in data_type.lower():
+    if data_type_enum in KLINE_DATA_TYPES:
         if not interval:
             click.echo("Error: --interval is required for klines data type", err=True)
             sys.exit(1)
-        try:
-            interval_enum = KlineInterval(interval)
-        except ValueError:
+        interval_enum = INTERVAL_BY_VALUE.get(interval)
+        if interval_enum is None:
             click.echo(f"Error: Invalid interval: {interval}", err=True)
             sys.exit(1)
     else:
@@ -52,33 +78,16 @@ async def run_sync(
 
     # Validate and normalize symbols format
     if symbols:
-        normalized_symbols = []
-        for symbol in symbols:
-            if not symbol.isupper():
-                logger.warning(f"Symbol '{symbol}' should be uppercase. Converting to '{symbol.upper()}'")
-                normalized_symbols.append(symbol.upper())
-            else:
-                normalized_symbols.append(symbol)
-        symbols = normalized_symbols
+        # One check on the joined symbols covers the common all-uppercase case
+        joined = "\x00".join(symbols)
+        if joined != joined.upper():
+            logger.warning("Some symbols were not uppercase, converting them to uppercase")
+            symbols = [symbol.upper() for symbol in symbols]
     try:
-        # DIAGNOSTIC SSL
-        import ssl
-        import certifi
-        
-        logger.debug("=== SSL Diagnostic ===")
-        logger.debug(f"Certifi path: {certifi.where()}")
-        logger.debug(f"SSL default paths: {ssl.get_default_verify_paths()}")
-        
-        # Test de connexion SSL basique
-        try:
-            import urllib.request
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            with urllib.request.urlopen('https://s3-ap-northeast-1.amazonaws.com', context=ssl_context, timeout=5) as _:
-                logger.debug("✅ SSL test connection successful")
-        except Exception as ssl_error:
-            logger.debug(f"SSL test failed: {ssl_error}")
-            logger.debug("Trying with alternative SSL configuration...")
-        
+        # Opt-in SSL diagnostic, a blocking request run off the event loop
+        if os.environ.get("BINANCE_SYNCER_SSL_DIAG") == "1":
+            await asyncio.to_thread(_ssl_diagnostic)
+
         # Create syncer instance
         syncer = Syncer(
             market_type=market_type_enum,
@@ -88,43 +97,46 @@ async def run_sync(
             s3=s3
         )
 
-        # Get symbols list
-        if symbols:
-            logger.info(f"Syncing {len(symbols)} specified symbols: {', '.join(symbols)}")
-        else:
-            logger.info("Fetching available symbols...")
-            all_symbols = await syncer.list_remote_symbols()
-            logger.info(f"Found {len(all_symbols)} available symbols")
-            symbols = all_symbols
-
-        # Dry run mode
-        if dry_run:
-            logger.info("\n=== DRY RUN MODE ===")
-            logger.info(f"Would sync {len(symbols)} symbols:")
+        # Share one HTTP session between the listing, the dry run and the sync
+        async with syncer:
+            if symbols:
+                # Lazy formatting: the symbol list is only rendered if the record is emitted
+                logger.info("Syncing %d specified symbols (%s..%s)", len(symbols), symbols[0], symbols[-1])
+
+            # Dry run mode
+            if dry_run:
+                # Without --symbols, list them here (sync() would otherwise do it)
+                if not symbols:
+                    logger.info("Fetching available symbols...")
+                    symbols = await syncer.list_remote_symbols()
+                    logger.info(f"Found {len(symbols)} available symbols")
+
+                logger.info("\n=== DRY RUN MODE ===")
+                logger.info(f"Would sync {len(symbols)} symbols:")
+                logger.info(f"  Market Type: {market_type}")
+                logger.info(f"  Data Type: {data_type}")
+                logger.info(f"  Interval: {interval or 'N/A'}")
+                logger.info("  Symbols: %s%s", symbols[:10], '...' if len(symbols) > 10 else '')
+            
+                # Show what would be synced for first symbol
+                if symbols:
+                    logger.info(f"\nAnalyzing first symbol: {symbols[0]}")
+                    dates_dict = await syncer.compute_dates_cover(symbols[0])
+                    logger.info(f"  Months to download: {len(dates_dict['M_DL'])}")
+                    logger.info(f"  Days to download: {len(dates_dict['D_DL'])}")
+                    logger.info(f"  Days to remove: {len(dates_dict['D_RM'])}")
+                return
+
+            # Run actual sync
+            logger.info("\nStarting synchronization...")
             logger.info(f"  Market Type: {market_type}")
             logger.info(f"  Data Type: {data_type}")
             logger.info(f"  Interval: {interval or 'N/A'}")
-            logger.info(f"  Symbols: {symbols[:10]}{'...' if len(symbols) > 10 else ''}")
-            
-            # Show what would be synced for first symbol
-            if symbols:
-                logger.info(f"\nAnalyzing first symbol: {symbols[0]}")
-                dates_dict = await syncer.compute_dates_cover(symbols[0])
-                logger.info(f"  Months to download: {len(dates_dict['M_DL'])}")
-                logger.info(f"  Days to download: {len(dates_dict['D_DL'])}")
-                logger.info(f"  Days to remove: {len(dates_dict['D_RM'])}")
-            return
-
-        # Run actual sync
-        logger.info("\nStarting synchronization...")
-        logger.info(f"  Market Type: {market_type}")
-        logger.info(f"  Data Type: {data_type}")
-        logger.info(f"  Interval: {interval or 'N/A'}")
-        logger.info(f"  Progress Bar: {'Enabled' if progress else 'Disabled'}")
-        logger.info(f"  Symbols: {len(symbols)} total")
-
-        await syncer.sync(symbols)
-        logger.info("\nSynchronization completed successfully!")
+            logger.info(f"  Progress Bar: {'Enabled' if progress else 'Disabled'}")
+            logger.info(f"  Symbols: {f'{len(symbols)} total' if symbols else 'all available'}")
+
+            await syncer.sync(symbols)
+            logger.info("\nSynchronization completed successfully!")
 
     except KeyboardInterrupt:
         logger.info("\nSynchronization interrupted by user")
@@ -134,6 +146,18 @@ async def run_sync(
         sys.exit(1)
 
 
+def _run(coro) -> None:
+    """Run a coroutine to completion, on a uvloop event loop when uvloop is installed."""
+    if uvloop is None:
+        asyncio.run(coro)
+    elif sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(coro)
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(coro)
+
+
 @click.command(
     help="Binance Data Synchronization Tool",
     epilog="""
@@ -154,19 +178,19 @@ Examples:
 )
 @click.option(
     '--market-type',
-    type=click.Choice([market.value for market in MarketType], case_sensitive=False),
+    type=click.Choice(MARKET_TYPE_VALUES, case_sensitive=False),
     required=True,
     help='Market type to sync (spot, futures/um, futures/cm, option)'
 )
 @click.option(
     '--data-type',
-    type=click.Choice([data.value for data in DataType], case_sensitive=False),
+    type=click.Choice(DATA_TYPE_VALUES, case_sensitive=False),
     required=True,
     help='Data type to sync (klines, trades, aggTrades, etc.)'
 )
 @click.option(
     '--interval',
-    type=click.Choice([interval.value for interval in KlineInterval], case_sensitive=False),
+    type=click.Choice(INTERVAL_VALUES, case_sensitive=False),
     default=None,
     help='Kline interval (required for klines data type)'
 )
@@ -208,7 +232,7 @@ def main(
 
     # Run synchronization
     try:
-        asyncio.run(run_sync(
+        _run(run_sync(
             market_type=market_type,
             data_type=data_type,
             interval=interval,
@@ -26,6 +26,14 @@ class DataType(Enum):
     BVOL_INDEX = "BVOLIndex"
     EOH_SUMMARY = "EOHSummary"
 
+# Data types organised by interval, that need a KlineInterval
+KLINE_DATA_TYPES = frozenset({
+    DataType.KLINES,
+    DataType.INDEX_PRICE_KLINES,
+    DataType.MARK_PRICE_KLINES,
+    DataType.PREMIUM_INDEX_KLINES,
+})
+
 class KlineInterval(Enum):
     S1 = "1s"
     M1 = "1m"
@@ -42,41 +50,58 @@ class KlineInterval(Enum):
     D1 = "1d"
     W1 = "1w"
 
+# Value -> member lookups, a plain dict access instead of the Enum call machinery
+MARKET_BY_VALUE = {m.value: m for m in MarketType}
+DATA_TYPE_BY_VALUE = {d.value: d for d in DataType}
+INTERVAL_BY_VALUE = {i.value: i for i in KlineInterval}
+
+# Accepted values, shared by the CLI choices and any other validation
+MARKET_TYPE_VALUES = tuple(MARKET_BY_VALUE)
+DATA_TYPE_VALUES = tuple(DATA_TYPE_BY_VALUE)
+INTERVAL_VALUES = tuple(INTERVAL_BY_VALUE)
+
+# Column layouts shared by several market/data types
+KLINE_COLUMNS = ('open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore')
+FUTURES_AGG_TRADES_COLUMNS = ('agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'transact_time', 'is_buyer_maker')
+BOOK_DEPTH_COLUMNS = ('timestamp', 'percentage', 'depth', 'notional')
+BOOK_TICKER_COLUMNS = ('update_id', 'best_bid_price', 'best_bid_qty', 'best_ask_price', 'best_ask_qty', 'transaction_time', 'event_time')
+METRICS_COLUMNS = ('create_time', 'symbol', 'sum_open_interest', 'sum_open_interest_value', 'count_toptrader_long_short_ratio', 'sum_toptrader_long_short_ratio', 'count_long_short_ratio', 'sum_taker_long_short_vol_ratio')
+
 SCHEMA = {
     MarketType.SPOT: {
-        DataType.AGG_TRADES:            ['agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'transact_time', 'is_buyer_maker', 'is_best_match'],
-        DataType.KLINES:                ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.TRADES:                ['id', 'price', 'qty', 'base_qty', 'time', 'is_buyer_maker', "is_best_match"]
+        DataType.AGG_TRADES:            ('agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'transact_time', 'is_buyer_maker', 'is_best_match'),
+        DataType.KLINES:                KLINE_COLUMNS,
+        DataType.TRADES:                ('id', 'price', 'qty', 'base_qty', 'time', 'is_buyer_maker', "is_best_match")
     },
     MarketType.OPTION : {
-        DataType.BVOL_INDEX:            ['calc_time', 'symbol', 'base_asset', 'quote_asset', 'index_value'],
-        DataType.EOH_SUMMARY:           ['date', 'hour', 'symbol', 'underlying', 'type', 'strike', 'open', 'high', 'low', 'close', 'volume_contracts', 'volume_usdt', 'best_bid_price', 'best_ask_price', 'best_bid_qty', 'best_ask_qty', 'best_buy_iv', 'best_sell_iv', 'mark_price', 'mark_iv', 'delta', 'gamma', 'vega', 'theta', 'openinterest_contracts', 'openinterest_usdt']
+        DataType.BVOL_INDEX:            ('calc_time', 'symbol', 'base_asset', 'quote_asset', 'index_value'),
+        DataType.EOH_SUMMARY:           ('date', 'hour', 'symbol', 'underlying', 'type', 'strike', 'open', 'high', 'low', 'close', 'volume_contracts', 'volume_usdt', 'best_bid_price', 'best_ask_price', 'best_bid_qty', 'best_ask_qty', 'best_buy_iv', 'best_sell_iv', 'mark_price', 'mark_iv', 'delta', 'gamma', 'vega', 'theta', 'openinterest_contracts', 'openinterest_usdt')
     },
     MarketType.FUTURES_CM: {
-        DataType.AGG_TRADES:            ['agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'transact_time', 'is_buyer_maker'],
-        DataType.BOOK_DEPTH:            ['timestamp', 'percentage', 'depth', 'notional'],
-        DataType.BOOK_TICKER:           ['update_id', 'best_bid_price', 'best_bid_qty', 'best_ask_price', 'best_ask_qty', 'transaction_time', 'event_time'],
-        DataType.INDEX_PRICE_KLINES:    ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.KLINES:                ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.LIQUIDATION_SNAPSHOT:  ['time', 'side', 'order_type', 'time_in_force', 'original_quantity', 'price', 'average_price', 'order_status', 'last_fill_quantity', 'accumulated_fill_quantity'],
-        DataType.MARK_PRICE_KLINES:     ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.METRICS:               ['create_time', 'symbol', 'sum_open_interest', 'sum_open_interest_value', 'count_toptrader_long_short_ratio', 'sum_toptrader_long_short_ratio', 'count_long_short_ratio', 'sum_taker_long_short_vol_ratio'],
-        DataType.PREMIUM_INDEX_KLINES:  ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.TRADES:                ['id', 'price', 'qty', 'base_qty', 'time', 'is_buyer_maker']
+        DataType.AGG_TRADES:            FUTURES_AGG_TRADES_COLUMNS,
+        DataType.BOOK_DEPTH:            BOOK_DEPTH_COLUMNS,
+        DataType.BOOK_TICKER:           BOOK_TICKER_COLUMNS,
+        DataType.INDEX_PRICE_KLINES:    KLINE_COLUMNS,
+        DataType.KLINES:                KLINE_COLUMNS,
+        DataType.LIQUIDATION_SNAPSHOT:  ('time', 'side', 'order_type', 'time_in_force', 'original_quantity', 'price', 'average_price', 'order_status', 'last_fill_quantity', 'accumulated_fill_quantity'),
+        DataType.MARK_PRICE_KLINES:     KLINE_COLUMNS,
+        DataType.METRICS:               METRICS_COLUMNS,
+        DataType.PREMIUM_INDEX_KLINES:  KLINE_COLUMNS,
+        DataType.TRADES:                ('id', 'price', 'qty', 'base_qty', 'time', 'is_buyer_maker')
     },
     MarketType.FUTURES_UM: {
-        DataType.AGG_TRADES:            ['agg_trade_id', 'price', 'quantity', 'first_trade_id', 'last_trade_id', 'transact_time', 'is_buyer_maker'],
-        DataType.BOOK_DEPTH:            ['timestamp', 'percentage', 'depth', 'notional'],
-        DataType.BOOK_TICKER:           ['update_id', 'best_bid_price', 'best_bid_qty', 'best_ask_price', 'best_ask_qty', 'transaction_time', 'event_time'],
-        DataType.INDEX_PRICE_KLINES:    ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.KLINES:                ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.MARK_PRICE_KLINES:     ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.METRICS:               ['create_time', 'symbol', 'sum_open_interest', 'sum_open_interest_value', 'count_toptrader_long_short_ratio', 'sum_toptrader_long_short_ratio', 'count_long_short_ratio', 'sum_taker_long_short_vol_ratio'],
-        DataType.PREMIUM_INDEX_KLINES:  ['open_time', 'open', 'high', 'low', 'close', 'volume', 'close_time', 'quote_volume', 'count', 'taker_buy_volume', 'taker_buy_quote_volume', 'ignore'],
-        DataType.TRADES:                ['id', 'price', 'qty', 'quote_qty', 'time', 'is_buyer_maker']
+        DataType.AGG_TRADES:            FUTURES_AGG_TRADES_COLUMNS,
+        DataType.BOOK_DEPTH:            BOOK_DEPTH_COLUMNS,
+        DataType.BOOK_TICKER:           BOOK_TICKER_COLUMNS,
+        DataType.INDEX_PRICE_KLINES:    KLINE_COLUMNS,
+        DataType.KLINES:                KLINE_COLUMNS,
+        DataType.MARK_PRICE_KLINES:     KLINE_COLUMNS,
+        DataType.METRICS:               METRICS_COLUMNS,
+        DataType.PREMIUM_INDEX_KLINES:  KLINE_COLUMNS,
+        DataType.TRADES:                ('id', 'price', 'qty', 'quote_qty', 'time', 'is_buyer_maker')
     }
 }
 
-TIME_COLUMNS = ['time', 'open_time', 'close_time', 'transact_time', 'event_time', 'transaction_time', 'calc_time']
-TIMESTAMP_COLUMNS = ['timestamp', 'create_time']
-DATE_COLUMNS = ['date']
\ No newline at end of file
+TIME_COLUMNS = ('time', 'open_time', 'close_time', 'transact_time', 'event_time', 'transaction_time', 'calc_time')
+TIMESTAMP_COLUMNS = ('timestamp', 'create_time')
+DATE_COLUMNS = ('date',)
\ No newline at end of file
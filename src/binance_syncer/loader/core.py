@@ -1,11 +1,16 @@
 import os
 import glob
+import json
+import threading
 import datetime as dt
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Sequence, Union, Tuple, Dict
 
 import duckdb
 import boto3
+import pyarrow as pa
+import pyarrow.dataset as ds
 
 from utilities import Config
 
@@ -42,12 +47,25 @@ TimeLike = Union[str, dt.datetime]
 
 LOCAL_PREFIX = Config.BINANCE_SYNCER.LOCAL.PATH
 
+
+@lru_cache(maxsize=128)
+def _sql_list_literal(paths: Tuple[str, ...]) -> str:
+    # Cached: reloading the same symbols rebuilds the same (possibly 10k paths) literal
+    return "[" + ", ".join(["'" + p.replace("'", "''") + "'" for p in paths]) + "]"
+
+
+# DuckDB connections shared by Loader instances, keyed by (db, threads, memory_limit)
+_CONN_POOL: Dict[tuple, duckdb.DuckDBPyConnection] = {}
+_S3_CONFIGURED: set = set()
+_CONN_LOCK = threading.Lock()
+
+
 class Loader:
     """
     DuckDB Parquet loader (optimized).
 
     Key optimizations vs the naive version:
-    - Cache schema + time column detection (per Loader instance).
+    - Cache schema + time column detection (shared by all Loader instances of the process).
     - Detect underlying *DuckDB type* of the time column and build WHERE predicates that
       preserve Parquet predicate pushdown when possible.
 
@@ -63,6 +81,18 @@ class Loader:
     S3_BUCKET = Config.BINANCE_SYNCER.S3.BUCKET
 
     _TIME_CANDIDATES = TIME_COLUMNS + TIMESTAMP_COLUMNS + DATE_COLUMNS
+    _TIME_CANDIDATES_LOWER = tuple(c.lower() for c in _TIME_CANDIDATES)
+
+    # process-wide caches, keyed by _shared_key()
+    _schema_cache: Dict[tuple, Tuple[List[str], bool]] = {}
+    _time_cache: Dict[tuple, Tuple[Optional[str], Optional[str]]] = {}
+    # time_cache: (detected_time_col, detected_time_kind)
+    _cache_lock = threading.Lock()
+
+    # use_arrow_dataset: view name and directory partition fields (dropped from the output)
+    _DATASET_VIEW = "binance_dataset"
+    _SYMBOL_PART = "__symbol"
+    _INTERVAL_PART = "__interval"
 
     # DuckDB type "hints" used to classify the time column
     _NUMERIC_HINTS = (
@@ -94,6 +124,7 @@ class Loader:
         default_time_unit: str = "ms",  # "ms" | "s"
         enable_cache: bool = True,
         s3: bool = False,  # if True, use s3fs for listing and reading (requires s3fs installed and configured)
+        use_arrow_dataset: bool = False,  # local only: read through a pyarrow dataset partitioned by symbol/interval
     ):
         self.market_type = market_type
         self.data_type = data_type
@@ -106,45 +137,88 @@ class Loader:
         self.default_time_unit = default_time_unit
         self.enable_cache = enable_cache
         self.s3 = s3
-        self.con = duckdb.connect(database=db)
-        if threads is not None:
-            self.con.execute(f"PRAGMA threads={int(threads)};")
-        if memory_limit:
-            self.con.execute(f"SET memory_limit='{memory_limit}';")
-
-        # Configure S3 support if needed
-        if s3:
-            self.s3_client = boto3.client('s3')
-            # Install and load httpfs extension for S3 support in DuckDB
-            try:
-                self.con.execute("INSTALL httpfs;")
-                self.con.execute("LOAD httpfs;")
-            except Exception:
-                pass  # Extension might already be installed
-            
-            # Configure AWS credentials for DuckDB
-            # Get credentials from boto3 session
-            session = boto3.Session()
-            credentials = session.get_credentials()
-            if credentials:
-                # Frozen credentials to avoid issues with temporary credentials
-                creds = credentials.get_frozen_credentials()
-                self.con.execute(f"SET s3_access_key_id='{creds.access_key}';")
-                self.con.execute(f"SET s3_secret_access_key='{creds.secret_key}';")
-                if creds.token:
-                    self.con.execute(f"SET s3_session_token='{creds.token}';")
-                
-                # Set the region if available
-                region = session.region_name
-                if region:
-                    self.con.execute(f"SET s3_region='{region}';")
-        else:
-            self.s3_client = None
+        self.use_arrow_dataset = use_arrow_dataset and not s3
+        self._dataset = None
+        self.s3_client = boto3.client('s3') if s3 else None
+
+        # One pooled DuckDB database per (db, threads, memory_limit): catalog, buffer pool and
+        # metadata caches are shared by every Loader, each one getting its own cursor
+        pool_key = (db, threads, memory_limit)
+        with _CONN_LOCK:
+            con = _CONN_POOL.get(pool_key)
+            if con is None:
+                con = duckdb.connect(database=db)
+                # Plain settings go in one round-trip
+                cfg_sql = []
+                if threads is not None:
+                    cfg_sql.append(f"PRAGMA threads={int(threads)};")
+                if memory_limit:
+                    cfg_sql.append(f"SET memory_limit={self._sql_string(memory_limit)};")
+                if cfg_sql:
+                    con.execute(" ".join(cfg_sql))
+                _CONN_POOL[pool_key] = con
+
+            # Configure S3 support if needed
+            if s3:
+                if pool_key not in _S3_CONFIGURED:
+                    self._configure_httpfs(con)
+                    _S3_CONFIGURED.add(pool_key)
+                # Credentials are refreshed by every S3 Loader (temporary credentials expire)
+                self._set_s3_credentials(con)
+
+        self.con = con.cursor()
 
         # per-instance caches
-        self._schema_cache: Dict[Tuple[str, str, Optional[str]], Tuple[List[str], bool]] = {}
-        self._time_cache: Dict[Tuple[str, str, Optional[str]], Tuple[Optional[str], Optional[str]]] = {}
-        # time_cache: (detected_time_col, detected_time_kind)
+        self._sql_cache: Dict[tuple, str] = {}
+        # sql_cache: query text by query shape (see _build_query)
+        self._s3_files_cache: Dict[Tuple[Tuple[str, str, Optional[str]], str, Optional[Tuple[str, str]]], Dict[str, List[str]]] = {}
+        # s3_files_cache: {symbol: [s3 urls]} from a single prefix listing, by symbol prefix and symbol range (None: all)
+
+        # schema + time detection persisted across instances (see _load_persistent_cache)
+        self._schema_cache_path = self.base_path / ".binance_syncer_cache" / "schema.json"
+        if self.enable_cache:
+            self._load_persistent_cache()
+
+    @staticmethod
+    def _configure_httpfs(con: duckdb.DuckDBPyConnection) -> None:
+        """One-time S3 setup of a pooled connection (settings are GLOBAL so cursors see them)."""
+        # Install (only if missing) and load httpfs extension for S3 support in DuckDB
+        try:
+            installed = con.execute(
+                "SELECT installed FROM duckdb_extensions() WHERE extension_name = 'httpfs'"
+            ).fetchone()
+            if not (installed and installed[0]):
+                con.execute("INSTALL httpfs;")
+            con.execute("LOAD httpfs;")
+        except Exception:
+            pass  # Extension might be built in or already loaded
+
+        # Cache HEAD responses and parsed parquet footers across queries, reuse HTTP connections
+        for setting in ("enable_http_metadata_cache=true", "parquet_metadata_cache=true", "http_keep_alive=true"):
+            try:
+                con.execute(f"SET GLOBAL {setting};")
+            except duckdb.Error:
+                pass  # Setting unknown to this DuckDB/httpfs version
+
+    @staticmethod
+    def _set_s3_credentials(con: duckdb.DuckDBPyConnection) -> None:
+        # Configure AWS credentials for DuckDB
+        # Get credentials from boto3 session
+        session = boto3.Session()
+        credentials = session.get_credentials()
+        if credentials:
+            # Frozen credentials to avoid issues with temporary credentials
+            creds = credentials.get_frozen_credentials()
+            # Bound parameters: secrets are never spliced into SQL text
+            con.execute("SET GLOBAL s3_access_key_id=?;", [creds.access_key])
+            con.execute("SET GLOBAL s3_secret_access_key=?;", [creds.secret_key])
+            if creds.token:
+                con.execute("SET GLOBAL s3_session_token=?;", [creds.token])
+
+            # Set the region if available
+            region = session.region_name
+            if region:
+                con.execute("SET GLOBAL s3_region=?;", [region])
 
     # ---------------------------------------------------------------------
     # Public API
@@ -159,13 +233,16 @@ class Loader:
         select_cols: Optional[Sequence[str]] = None,
         # only relevant if time col is numeric (epoch); should be unused in your setup
         time_unit: Optional[str] = None,  # "ms" | "s"
+        as_arrow: bool = False,  # return the pyarrow.Table instead of a pandas DataFrame
+        symbols_startswith: str = "",  # when symbols is None: only symbols starting with this (e.g. "BTC")
     ):
         if symbols is None:
-            symbols = self.available_symbols()
+            symbols = self.available_symbols(symbols_startswith)
         if isinstance(symbols, str):
             symbols = [symbols]
 
-        globs_ = self._build_globs(symbols)
+        symbol_globs = self._build_globs(symbols)
+        globs_ = [g for gs in symbol_globs.values() for g in gs]
         if not globs_:
             raise FileNotFoundError(
                 f"No parquet found for market={self.market_type.value}, data={self.data_type.value}, "
@@ -194,16 +271,17 @@ class Loader:
         # time kind only needed if we filter on time
         time_kind = None
         if time_col and (start is not None or end is not None):
-            # use cached kind if present, else detect and cache
-            _, cached_kind = self._get_cached_time_detection()
-            time_kind = cached_kind
+            # use cached kind if present, else detect and cache (only for the detected time column,
+            # a user override must not leak into other loads)
+            cached_col, cached_kind = self._get_cached_time_detection()
+            time_kind = cached_kind if time_col == cached_col else None
             if time_kind is None:
                 time_kind = self._detect_time_kind(globs_, time_col)
-                if self.enable_cache:
+                if self.enable_cache and time_col == cached_col:
                     self._set_cached_time_detection(time_col, time_kind)
 
-        sql = self._build_query(
-            globs_=globs_,
+        sql, params = self._build_query(
+            symbol_globs=symbol_globs,
             columns=columns,
             has_symbol=has_symbol,
             time_col=time_col,
@@ -214,45 +292,20 @@ class Loader:
             select_cols=select_cols,
         )
 
-        out = self.con.execute(sql).fetchdf()
-        if "filename" in out.columns:
-            del out["filename"]
-        return out
-
-    def available_symbols(self) -> List[str]:
+        if self.use_arrow_dataset:
+            # DuckDB scans the registered dataset and pushes projection / time filters into it
+            self.con.register(self._DATASET_VIEW, self._symbol_dataset(list(symbol_globs)))
+        tbl = self.con.execute(sql, params).fetch_arrow_table()
+        if as_arrow:
+            return tbl
+        # self_destruct frees each Arrow column once converted: peak memory stays ~1x the result
+        return tbl.to_pandas(self_destruct=True, split_blocks=True, use_threads=True)
+
+    def available_symbols(self, prefix: str = "") -> List[str]:
+        """Symbols holding at least one file (for the interval, if any), optionally only those starting with `prefix`."""
         if self.s3:
-            # Build prefix up to data_type level (e.g. "binance/data/spot/klines/")
-            # We cannot use build_save_path(S3_PREFIX, "") here because an empty symbol
-            # produces a double-slash and the interval gets appended at the wrong level.
-            base_prefix = "/".join([
-                self.S3_PREFIX, "data", self.market_type.value, self.data_type.value
-            ]) + "/"
-
-            paginator = self.s3_client.get_paginator("list_objects_v2")
-            syms: List[str] = []
-
-            # One paginated call to get all symbol-level "directories"
-            for page in paginator.paginate(Bucket=self.S3_BUCKET, Prefix=base_prefix, Delimiter="/"):
-                for common_prefix in page.get("CommonPrefixes", []):
-                    symbol = common_prefix["Prefix"].rstrip("/").split("/")[-1]
-                    if not symbol:
-                        continue
-
-                    # If an interval is set, verify this symbol actually has data for it
-                    # (MaxKeys=1 is a cheap existence check — no full scan)
-                    if self.interval:
-                        interval_prefix = f"{base_prefix}{symbol}/{self.interval.value}/"
-                        resp = self.s3_client.list_objects_v2(
-                            Bucket=self.S3_BUCKET,
-                            Prefix=interval_prefix,
-                            MaxKeys=1,
-                        )
-                        if not resp.get("Contents"):
-                            continue
-
-                    syms.append(symbol)
-
-            return sorted(syms)
+            # From the single prefix listing, narrowed server-side to the symbol prefix
+            return sorted(self._list_s3_files(prefix=prefix))
         else:
             # List symbols from local filesystem
             root = self.base_path / "data" / self.market_type.value / self.data_type.value
@@ -260,10 +313,11 @@ class Loader:
                 return []
 
             syms: List[str] = []
-            for sym in os.listdir(root):
-                p = root / sym / (self.interval.value if self.interval else "")
-                if p.is_dir() and glob.glob(str(p / "*.parquet")):
-                    syms.append(sym)
+            with os.scandir(root) as it:
+                for entry in it:
+                    p = os.path.join(entry.path, self.interval.value) if self.interval else entry.path
+                    if entry.name.startswith(prefix) and entry.is_dir() and self._has_parquet(p):
+                        syms.append(entry.name)
             return sorted(syms)
 
     # ---------------------------------------------------------------------
@@ -277,69 +331,303 @@ class Loader:
             str(self.interval.value) if self.interval else None,
         )
 
+    def _source(self) -> str:
+        """The store the parquet files are read from: "local" or "s3://<bucket>/<prefix>"."""
+        return f"s3://{self.S3_BUCKET}/{self.S3_PREFIX}" if self.s3 else "local"
+
+    def _shared_key(self) -> tuple:
+        # local and S3 stores (or two base paths / buckets) may hold different schemas
+        return (
+            type(self).__name__,
+            *self._cache_key(),
+            str(self.base_path),
+            self._source(),
+            self.union_by_name,
+        )
+
     def _get_schema_and_symbol(self, globs_: Sequence[str]) -> Tuple[List[str], bool]:
-        key = self._cache_key()
-        if self.enable_cache and key in self._schema_cache:
-            return self._schema_cache[key]
+        key = self._shared_key()
+        if self.enable_cache:
+            with self._cache_lock:
+                cached = self._schema_cache.get(key)
+            if cached is not None:
+                return cached
 
         columns = self._describe_columns(globs_)
         has_symbol = any(c.lower() == "symbol" for c in columns)
 
         if self.enable_cache:
-            self._schema_cache[key] = (columns, has_symbol)
+            with self._cache_lock:
+                self._schema_cache[key] = (columns, has_symbol)
+            self._persist_cache()
         return columns, has_symbol
 
     def _get_cached_time_detection(self) -> Tuple[Optional[str], Optional[str]]:
-        key = self._cache_key()
-        if self.enable_cache and key in self._time_cache:
-            return self._time_cache[key]
+        if self.enable_cache:
+            with self._cache_lock:
+                return self._time_cache.get(self._shared_key(), (None, None))
         return None, None
 
     def _set_cached_time_detection(self, time_col: Optional[str], time_kind: Optional[str]) -> None:
-        key = self._cache_key()
-        self._time_cache[key] = (time_col, time_kind)
+        key = self._shared_key()
+        with self._cache_lock:
+            if self._time_cache.get(key) == (time_col, time_kind):
+                return
+            self._time_cache[key] = (time_col, time_kind)
+        if time_kind is not None:
+            self._persist_cache()
+
+    def _persistent_key(self) -> str:
+        # same scope as _shared_key: one schema.json under base_path may serve local and S3 loaders
+        market, data, interval = self._cache_key()
+        return (
+            f"{self._source()}|{market}/{data}/{interval or '-'}"
+            f"/union_by_name={str(self.union_by_name).lower()}"
+        )
+
+    def _read_persistent_cache(self) -> Dict[str, dict]:
+        try:
+            with open(self._schema_cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _load_persistent_cache(self) -> None:
+        """
+        Seed the schema and time detection caches from the JSON file under base_path, so that
+        new Loader instances skip the DESCRIBE round-trips (one parquet footer read per file).
+        """
+        entry = self._read_persistent_cache().get(self._persistent_key())
+        if not isinstance(entry, dict):
+            return
+        key = self._shared_key()
+        columns = entry.get("columns")
+        with self._cache_lock:
+            if isinstance(columns, list):
+                self._schema_cache.setdefault(key, (columns, bool(entry.get("has_symbol"))))
+            if entry.get("time_kind") is not None:
+                self._time_cache.setdefault(key, (entry.get("time_col"), entry["time_kind"]))
+
+    def _persist_cache(self) -> None:
+        """Write-through of this instance's schema and time detection to the JSON cache file."""
+        key = self._shared_key()
+        entry: dict = {}
+        with self._cache_lock:
+            schema = self._schema_cache.get(key)
+            time_col, time_kind = self._time_cache.get(key, (None, None))
+        if schema is not None:
+            columns, has_symbol = schema
+            entry.update(columns=list(columns), has_symbol=has_symbol)
+        if time_kind is not None:
+            entry.update(time_col=time_col, time_kind=time_kind)
+
+        data = self._read_persistent_cache()
+        data[self._persistent_key()] = entry
+        # Best effort: an unwritable base_path only costs a DESCRIBE next time
+        try:
+            self._schema_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self._schema_cache_path.with_name(f"{self._schema_cache_path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp, self._schema_cache_path)
+        except OSError:
+            pass
+
+    def _symbol_dataset(self, symbols: Sequence[str]) -> ds.Dataset:
+        """
+        Local store as a pyarrow dataset, with the <symbol>[/<interval>] directories as partition
+        fields. File discovery happens once per Loader, each load only filters the partitions.
+        """
+        if self._dataset is None:
+            fields = [(self._SYMBOL_PART, pa.string())]
+            if self.interval:
+                fields.append((self._INTERVAL_PART, pa.string()))
+            root = self.base_path / "data" / self.market_type.value / self.data_type.value
+            self._dataset = ds.dataset(
+                str(root),
+                format="parquet",
+                partitioning=ds.partitioning(pa.schema(fields)),
+            )
 
-    def _build_globs(self, symbols: Sequence[str]) -> List[str]:
-        out: List[str] = []
+        expr = ds.field(self._SYMBOL_PART).isin(list(symbols))
+        if self.interval:
+            expr = expr & (ds.field(self._INTERVAL_PART) == self.interval.value)
+        return self._dataset.filter(expr)
+
+    def _build_globs(self, symbols: Sequence[str]) -> Dict[str, List[str]]:
+        """Return {symbol: [globs or s3 URLs]}, empty if no file matches."""
+        out: Dict[str, List[str]] = {}
         if self.s3:
-            # Build S3 URLs for DuckDB
+            # S3 URLs for DuckDB, from a single listing bounded to the symbols (see _list_s3_files)
+            files = self._list_s3_files(symbols)
             for s in symbols:
-                prefix = self.path_builder.build_save_path(self.S3_PREFIX, s, "")
-                # List files on S3 for this symbol
-                paginator = self.s3_client.get_paginator("list_objects_v2")
-                for page in paginator.paginate(Bucket=self.S3_BUCKET, Prefix=prefix):
-                    for obj in page.get("Contents", []):
-                        key = obj["Key"]
-                        if key.endswith(".parquet"):
-                            # DuckDB can read from S3 with s3:// URLs
-                            s3_url = f"s3://{self.S3_BUCKET}/{key}"
-                            out.append(s3_url)
+                if files.get(s):
+                    out[s] = files[s]
             return out
         else:
             # Build local file globs
+            found = False
             for s in symbols:
-                p = self.path_builder.build_save_path(str(self.base_path), s, "*.parquet")
-                out.append(str(p))
-            return out if any(glob.glob(g) for g in out) else []
+                p = self.path_builder.build_save_path(str(self.base_path), s)
+                out[s] = [f"{p}/*.parquet"]
+                found = found or self._has_parquet(p)
+            return out if found else {}
+
+    @staticmethod
+    def _has_parquet(directory: str) -> bool:
+        """True if `directory` holds at least one .parquet file (stops at the first one)."""
+        try:
+            with os.scandir(directory) as it:
+                return any(e.name.endswith(".parquet") and e.is_file() for e in it)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+
+    def _s3_base_prefix(self) -> str:
+        # Build prefix up to data_type level (e.g. "binance/data/spot/klines/")
+        # We cannot use build_save_path(S3_PREFIX, "") here because an empty symbol
+        # produces a double-slash and the interval gets appended at the wrong level.
+        return "/".join([
+            self.S3_PREFIX, "data", self.market_type.value, self.data_type.value
+        ]) + "/"
+
+    def _list_s3_files(self, symbols: Optional[Sequence[str]] = None, prefix: str = "") -> Dict[str, List[str]]:
+        """
+        List the parquet files with one paginated listing of the data type prefix, instead of one listing
+        per symbol. The layout, the interval and the symbols are filtered client-side.
+        - `prefix` (a symbol prefix) narrows the listing server-side.
+        - With `symbols`, the listing is bounded to their key range: the longest common symbol prefix, StartAfter
+          the first symbol and an early stop after the last one, so a narrow symbol set does not list the others.
+        Listings are cached per symbol prefix (and range), a full listing serves every narrower request.
+        Returns {symbol: [s3:// URLs]}.
+        """
+        wanted = None
+        bounds = None
+        if symbols is not None:
+            wanted = set(symbols)
+            if not wanted:
+                return {}
+            bounds = (min(wanted), max(wanted))
+            prefix = os.path.commonprefix(bounds)
+
+        def select(files: Dict[str, List[str]]) -> Dict[str, List[str]]:
+            return {s: f for s, f in files.items() if s.startswith(prefix) and (wanted is None or s in wanted)}
+
+        cache_key = self._cache_key()
+        if self.enable_cache:
+            # Any cached listing covering this prefix (and range) holds every file requested
+            for (key, cached_prefix, cached_bounds), files in self._s3_files_cache.items():
+                if key == cache_key and prefix.startswith(cached_prefix) and (
+                    cached_bounds is None
+                    or (bounds is not None and cached_bounds[0] <= bounds[0] and bounds[1] <= cached_bounds[1])
+                ):
+                    return select(files)
+
+        base_prefix = self._s3_base_prefix()
+        # Relative key layout: "<symbol>/<interval>/<file>" for klines, "<symbol>/<file>" otherwise
+        depth = 3 if self.interval else 2
+        params = {"Bucket": self.S3_BUCKET, "Prefix": base_prefix + prefix, "PaginationConfig": {"PageSize": 1000}}
+        stop = None
+        if bounds is not None:
+            # Keys come in lexicographic order and the keys of a symbol all start with "<symbol>/":
+            # they sort after "<symbol>" and before "<symbol>0" ("0" follows "/")
+            params["StartAfter"] = base_prefix + bounds[0]
+            stop = base_prefix + bounds[1] + "0"
+
+        files: Dict[str, List[str]] = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(**params):
+            contents = page.get("Contents", [])
+            for obj in contents:
+                obj_key = obj["Key"]
+                if stop is not None and obj_key >= stop:
+                    break
+                if not obj_key.endswith(".parquet"):
+                    continue
+                parts = obj_key[len(base_prefix):].split("/")
+                if len(parts) != depth or (self.interval and parts[1] != self.interval.value):
+                    continue
+                # DuckDB can read from S3 with s3:// URLs
+                files.setdefault(parts[0], []).append(f"s3://{self.S3_BUCKET}/{obj_key}")
+            if stop is not None and contents and contents[-1]["Key"] >= stop:
+                # Past the last symbol: the next pages are not requested
+                break
+
+        if self.enable_cache:
+            self._s3_files_cache[(cache_key, prefix, bounds)] = files
+        return select(files)
+
+    def _sample_file(self, globs_: Sequence[str]) -> Optional[str]:
+        """
+        Most recent file (file names end with YYYY-MM[-DD]) of the first symbol with data.
+        Files of one (market, data_type, interval) share a schema, so it stands for the whole glob.
+        """
+        if self.s3:
+            return max(globs_, key=os.path.basename) if globs_ else None
+        for g in globs_:
+            files = glob.glob(g)
+            if files:
+                return max(files, key=os.path.basename)
+        return None
+
+    def _parquet_schema(self, globs_: Sequence[str]) -> Optional[List[Tuple[str, str, str, str]]]:
+        """
+        Top-level (name, type, converted_type, logical_type) of the sample file, read from its
+        footer with parquet_schema() (no scan is bound or planned).
+        Returns None for nested schemas or unreadable files, which go through DESCRIBE instead.
+        """
+        sample = self._sample_file(globs_)
+        if sample is None:
+            return None
+        try:
+            rows = self.con.execute(
+                "SELECT name, type, converted_type, logical_type, num_children "
+                f"FROM parquet_schema({self._list_literal_sql([sample])})"
+            ).fetchall()
+        except duckdb.Error:
+            return None
+        # First row is the schema root, the others are the columns
+        fields = rows[1:]
+        if not fields or any(r[4] for r in fields):
+            return None
+        return [(str(r[0]), str(r[1] or ""), str(r[2] or ""), str(r[3] or "")) for r in fields]
+
+    def _describe(self, globs_: Sequence[str], select: str):
+        """
+        DESCRIBE `select` against a single sample file, which reads one parquet footer instead of
+        one per file. Falls back to the full glob (union_by_name) if the sample cannot be read.
+        """
+        sample = self._sample_file(globs_)
+        if sample is not None:
+            try:
+                return self.con.execute(
+                    f"DESCRIBE SELECT {select} FROM read_parquet({self._list_literal_sql([sample])}) LIMIT 0"
+                ).fetchdf()
+            except duckdb.Error:
+                pass
 
-    def _describe_columns(self, globs_: Sequence[str]) -> List[str]:
         globs_sql = self._list_literal_sql(globs_)
-        df = self.con.execute(
+        return self.con.execute(
             f"""
             DESCRIBE
-            SELECT *
+            SELECT {select}
             FROM read_parquet({globs_sql}, union_by_name={str(self.union_by_name).lower()})
             LIMIT 0
             """
         ).fetchdf()
-        return df["column_name"].tolist()
+
+    def _describe_columns(self, globs_: Sequence[str]) -> List[str]:
+        schema = self._parquet_schema(globs_)
+        if schema is not None:
+            return [name for name, *_ in schema]
+        return self._describe(globs_, "*")["column_name"].tolist()
 
     def _detect_time_column(self, columns: Sequence[str]) -> Optional[str]:
-        low = [c.lower() for c in columns]
-        for cand in self._TIME_CANDIDATES:
-            cl = cand.lower()
-            if cl in low:
-                return columns[low.index(cl)]
+        # reversed: the first column wins when two only differ by case
+        low_to_orig = {c.lower(): c for c in reversed(columns)}
+        for cl in self._TIME_CANDIDATES_LOWER:
+            if cl in low_to_orig:
+                return low_to_orig[cl]
         return None
 
     def _detect_time_kind(self, globs_: Sequence[str], time_col: str) -> str:
@@ -347,15 +635,13 @@ class Loader:
         Return kind ∈ {"timestamp","date","numeric","string"} based on DuckDB's inferred type.
         In your pipeline this should almost always be "timestamp".
         """
-        globs_sql = self._list_literal_sql(globs_)
-        desc = self.con.execute(
-            f"""
-            DESCRIBE
-            SELECT {self._quote_ident(time_col)}
-            FROM read_parquet({globs_sql}, union_by_name={str(self.union_by_name).lower()})
-            LIMIT 0
-            """
-        ).fetchdf()
+        schema = self._parquet_schema(globs_)
+        if schema is not None:
+            for name, ptype, converted, logical in schema:
+                if name.lower() == time_col.lower():
+                    return self._parquet_time_kind(ptype.upper(), converted.upper(), logical.upper())
+
+        desc = self._describe(globs_, self._quote_ident(time_col))
 
         tname = str(desc.loc[0, "column_type"]).upper()
 
@@ -368,9 +654,23 @@ class Loader:
             return "numeric"
         return "string"
 
+    @staticmethod
+    def _parquet_time_kind(ptype: str, converted: str, logical: str) -> str:
+        """Same classification as _detect_time_kind, from parquet physical/converted/logical types."""
+        # e.g. logical TimestampType(...), converted TIMESTAMP_MILLIS, legacy INT96
+        if "TIMESTAMP" in logical or converted.startswith("TIMESTAMP") or ptype == "INT96":
+            return "timestamp"
+        if "DATE" in logical or converted == "DATE":
+            return "date"
+        if ptype in ("BYTE_ARRAY", "FIXED_LEN_BYTE_ARRAY") and "DECIMAL" not in logical + converted:
+            return "string"
+        if ptype in ("INT32", "INT64", "FLOAT", "DOUBLE") or "DECIMAL" in logical + converted:
+            return "numeric"
+        return "string"
+
     def _build_query(
         self,
-        globs_: Sequence[str],
+        symbol_globs: Dict[str, List[str]],
         columns: Sequence[str],
         has_symbol: bool,
         time_col: Optional[str],
@@ -379,19 +679,98 @@ class Loader:
         start: Optional[TimeLike],
         end: Optional[TimeLike],
         select_cols: Optional[Sequence[str]],
-    ) -> str:
-        globs_sql = self._list_literal_sql(globs_)
-
-        # Normalize path separators for regex (Windows-safe)
-        fname = "replace(filename, '\\\\', '/')"
+    ) -> Tuple[str, list]:
+        """
+        Return (sql, params). Time bounds are bound as parameters, so the SQL text only depends on
+        the query shape and is cached for repeated loads over different time windows.
+        """
+        kind = time_kind or "timestamp"  # if unknown, assume timestamp (your pipeline)
+        filter_time = bool(time_col) and (start is not None or end is not None)
+
+        # --- bound values of the WHERE clause, in placeholder order ---
+        params: list = []
+        if filter_time:
+            if kind == "numeric" and time_unit not in ("ms", "s"):
+                raise ValueError("time_unit must be 'ms' or 's' for numeric time columns.")
+            for bound in (start, end):
+                if bound is None:
+                    continue
+                if kind == "date":
+                    params.append(self._to_date_param(bound))
+                elif kind == "numeric":
+                    params.append(self._to_epoch_param(bound, time_unit))
+                else:
+                    params.append(self._to_timestamp_param(bound))
+
+        shape = (
+            tuple((s, tuple(gs)) for s, gs in symbol_globs.items()),
+            tuple(columns),
+            has_symbol,
+            time_col if filter_time else None,
+            kind if filter_time else None,
+            start is not None and filter_time,
+            end is not None and filter_time,
+            tuple(select_cols) if select_cols is not None else None,
+        )
+        sql = self._sql_cache.get(shape)
+        if sql is None:
+            if len(self._sql_cache) >= 128:
+                self._sql_cache.clear()
+            sql = self._sql_cache[shape] = self._build_sql(
+                symbol_globs, has_symbol, time_col if filter_time else None, kind, start, end, select_cols
+            )
+        return sql, params
 
-        m = self._re_escape(self.market_type.value)
-        d = self._re_escape(self.data_type.value)
-        symbol_from_path = f"regexp_extract({fname}, '/{m}/{d}/([^/]+)/', 1)"
+    def _build_sql(
+        self,
+        symbol_globs: Dict[str, List[str]],
+        has_symbol: bool,
+        time_col: Optional[str],
+        kind: str,
+        start: Optional[TimeLike],
+        end: Optional[TimeLike],
+        select_cols: Optional[Sequence[str]],
+    ) -> str:
+        union_by_name = str(self.union_by_name).lower()
+
+        # --- symbol ---
+        # symbol_column: the scanned relation already has a symbol column
+        symbol_column = self.use_arrow_dataset or has_symbol
+        # path_symbol: the symbol can only come from the file path, the one case where the file name is read
+        path_symbol = not symbol_column and len(symbol_globs) > 1
+        if symbol_column:
+            symbol_expr = self._quote_ident("symbol")
+        elif not path_symbol:
+            # Globs are built per symbol: a single symbol is a constant, no per-row work
+            symbol_expr = self._sql_string(next(iter(symbol_globs)))
+        else:
+            # Path layout ".../<symbol>[/<interval>]/<file>": the symbol is a fixed path component, no regex needed
+            fname = "filename"
+            if os.sep == "\\" and not self.s3:
+                # Local Windows paths use backslashes, S3 URLs always use slashes
+                fname = "replace(filename, '\\', '/')"
+            symbol_expr = f"string_split({fname}, '/')[{-3 if self.interval else -2}]"
+
+        # --- FROM ---
+        if self.use_arrow_dataset:
+            parts = [self._SYMBOL_PART] + ([self._INTERVAL_PART] if self.interval else [])
+            exclude = f"* EXCLUDE ({', '.join(parts)})"
+            select = exclude if has_symbol else f"{self._SYMBOL_PART} AS symbol, {exclude}"
+            from_sql = f"(SELECT {select} FROM {self._DATASET_VIEW})"
+        else:
+            # One scan over every file
+            globs_sql = self._list_literal_sql([g for gs in symbol_globs.values() for g in gs])
+            filename_opt = ", filename=true" if path_symbol else ""
+            from_sql = f"read_parquet({globs_sql}, union_by_name={union_by_name}{filename_opt})"
 
         # --- SELECT list ---
         if select_cols is None:
-            select_list = "t.*" if has_symbol else f"{symbol_from_path} AS symbol, t.*"
+            if symbol_column:
+                select_list = "t.*"
+            elif path_symbol:
+                select_list = f"{symbol_expr} AS symbol, t.* EXCLUDE (filename)"
+            else:
+                select_list = f"{symbol_expr} AS symbol, t.*"
         else:
             wanted = list(select_cols)
 
@@ -399,59 +778,39 @@ class Loader:
                 if not has_symbol:
                     wanted = ["symbol"] + wanted
 
-            projected: List[str] = []
-            for c in wanted:
-                if c.lower() == "symbol":
-                    projected.append(self._quote_ident("symbol") if has_symbol else f"{symbol_from_path} AS symbol")
-                else:
-                    projected.append(self._quote_ident(c))
-            select_list = ", ".join(projected)
+            select_list = ", ".join(
+                f"{symbol_expr} AS symbol" if c.lower() == "symbol" and not symbol_column else self._quote_ident(c)
+                for c in wanted
+            )
 
-        # --- WHERE clause on time column (pushdown-friendly when possible) ---
+        # --- WHERE clause on time column (pushdown-friendly when possible, bound by _build_query) ---
         where_parts: List[str] = []
-        if time_col and (start is not None or end is not None):
+        if time_col:
             tc = self._quote_ident(time_col)
-            kind = time_kind or "timestamp"  # if unknown, assume timestamp (your pipeline)
 
             if kind == "timestamp":
                 # Best case: WHERE directly on timestamp column -> pushdown
-                if start is not None:
-                    where_parts.append(f"{tc} >= {self._to_timestamp_literal(start)}")
-                if end is not None:
-                    where_parts.append(f"{tc} <= {self._to_timestamp_literal(end)}")
-
+                col, ph = tc, "CAST(? AS TIMESTAMP)"
             elif kind == "date":
-                # If stored as DATE, compare to DATE literals (also pushdown-ish)
-                if start is not None:
-                    where_parts.append(f"{tc} >= {self._to_date_literal(start)}")
-                if end is not None:
-                    where_parts.append(f"{tc} <= {self._to_date_literal(end)}")
-
+                # If stored as DATE, compare to DATE values (also pushdown-ish)
+                col, ph = tc, "CAST(? AS DATE)"
             elif kind == "numeric":
                 # Epoch numeric fallback (shouldn't happen if you always wrote timestamp)
-                if time_unit not in ("ms", "s"):
-                    raise ValueError("time_unit must be 'ms' or 's' for numeric time columns.")
-                if start is not None:
-                    where_parts.append(f"{tc} >= {self._to_epoch_literal(start, time_unit)}")
-                if end is not None:
-                    where_parts.append(f"{tc} <= {self._to_epoch_literal(end, time_unit)}")
-
+                col, ph = tc, "?"
             else:
                 # String fallback: cast in predicate (less pushdown)
-                if start is not None:
-                    where_parts.append(f"CAST({tc} AS TIMESTAMP) >= {self._to_timestamp_literal(start)}")
-                if end is not None:
-                    where_parts.append(f"CAST({tc} AS TIMESTAMP) <= {self._to_timestamp_literal(end)}")
+                col, ph = f"CAST({tc} AS TIMESTAMP)", "CAST(? AS TIMESTAMP)"
+
+            if start is not None:
+                where_parts.append(f"{col} >= {ph}")
+            if end is not None:
+                where_parts.append(f"{col} <= {ph}")
 
         where_sql = ("WHERE " + " AND ".join(where_parts)) if where_parts else ""
 
         sql = f"""
         SELECT {select_list}
-        FROM read_parquet(
-            {globs_sql},
-            union_by_name={str(self.union_by_name).lower()},
-            filename=true
-        ) AS t
+        FROM {from_sql} AS t
         {where_sql}
         ;
         """
@@ -463,8 +822,7 @@ class Loader:
 
     @staticmethod
     def _list_literal_sql(paths: Sequence[str]) -> str:
-        esc = lambda p: p.replace("'", "''") # noqa: E731
-        return "[" + ", ".join(f"'{esc(p)}'" for p in paths) + "]"
+        return _sql_list_literal(tuple(paths))
 
     @staticmethod
     def _quote_ident(name: str) -> str:
@@ -472,40 +830,37 @@ class Loader:
         return f'"{safe}"'
 
     @staticmethod
-    def _to_timestamp_literal(x: TimeLike) -> str:
+    def _to_timestamp_param(x: TimeLike) -> Union[str, dt.datetime]:
         """
-        DuckDB TIMESTAMP literal (no unit conversion here).
+        Value bound to CAST(? AS TIMESTAMP) (no unit conversion here).
         """
         if isinstance(x, dt.datetime):
             if x.tzinfo is not None:
                 x = x.astimezone(dt.timezone.utc).replace(tzinfo=None)
-            s = x.strftime("%Y-%m-%d %H:%M:%S.%f").rstrip("0").rstrip(".")
-            return f"TIMESTAMP '{s}'"
-        s = str(x).replace("'", "''")
-        return f"TIMESTAMP '{s}'"
+            return x
+        return str(x)
 
     @staticmethod
-    def _to_date_literal(x: TimeLike) -> str:
+    def _to_date_param(x: TimeLike) -> str:
         """
-        DuckDB DATE literal. If datetime provided, we take the date part (UTC-normalized).
+        Value bound to CAST(? AS DATE). If datetime provided, we take the date part (UTC-normalized).
         """
         if isinstance(x, dt.datetime):
             if x.tzinfo is not None:
                 x = x.astimezone(dt.timezone.utc).date()
             else:
                 x = x.date()
-            s = x.isoformat()
-            return f"DATE '{s}'"
+            return x.isoformat()
         # string: take first 10 chars if ISO, otherwise let DuckDB parse
-        s = str(x).replace("'", "''")
-        # If user passes a full timestamp string, DATE '2025-01-01 00:00:00' is not valid,
+        s = str(x)
+        # If user passes a full timestamp string, CAST('2025-01-01 00:00:00' AS DATE) is not valid,
         # so try to strip if it looks ISO-ish.
         if len(s) >= 10 and s[4] == "-" and s[7] == "-":
             s = s[:10]
-        return f"DATE '{s}'"
+        return s
 
     @staticmethod
-    def _to_epoch_literal(x: TimeLike, unit: str) -> str:
+    def _to_epoch_param(x: TimeLike, unit: str) -> int:
         """
         Convert datetime/iso-string to numeric epoch in seconds or milliseconds.
         Used only if the parquet time column is numeric (fallback).
@@ -525,8 +880,8 @@ class Loader:
                 dtobj = dtobj.astimezone(dt.timezone.utc)
 
         sec = dtobj.timestamp()
-        return str(int(sec * 1000) if unit == "ms" else int(sec))
+        return int(sec * 1000) if unit == "ms" else int(sec)
 
     @staticmethod
-    def _re_escape(x: str) -> str:
-        return x.replace(".", "\\.").replace("-", "\\-")
\ No newline at end of file
+    def _sql_string(x: str) -> str:
+        return "'" + x.replace("'", "''") + "'"
\ No newline at end of file
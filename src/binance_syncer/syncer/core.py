@@ -1,20 +1,82 @@
+import os
+import re
+import ssl
+import certifi
+import json
+import time
 import aiohttp
 import asyncio
-import pandas as pd
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 from zipfile import ZipFile
 from io import BytesIO
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+from typing import Optional
+from contextlib import asynccontextmanager
+from functools import lru_cache
 import xml.etree.ElementTree as ET
+from yarl import URL
+from rich import get_console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn, TimeRemainingColumn
 from utilities import Config, LoggingConfigurator
 
-from ..constant import MarketType, DataType, Frequency, KlineInterval, SCHEMA, TIME_COLUMNS, TIMESTAMP_COLUMNS, DATE_COLUMNS
-from binance_syncer.utils import BinancePathBuilder, safe_parse_time
+from ..constant import BASE_URL, MarketType, DataType, Frequency, KlineInterval, SCHEMA, TIME_COLUMNS, TIMESTAMP_COLUMNS, DATE_COLUMNS
+from binance_syncer.utils import BinancePathBuilder, epoch_unit
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+# Date part of a Binance archive name, e.g. "BTCUSDT-1d-2024-01.zip" -> "2024-01"
+_DATE_KEY_RE = re.compile(r'-(\d{4}-\d{2}(?:-\d{2})?)\.zip$')
+
+# Arrow types of the known Binance columns, so that a column keeps the same type whatever the content of a file.
+# Epoch time columns are read as integers and converted afterwards, their unit (ms/us) depends on the file.
+_FLOAT_COLUMNS = [
+    'price', 'quantity', 'qty', 'base_qty', 'quote_qty',
+    'open', 'high', 'low', 'close', 'volume', 'quote_volume', 'taker_buy_volume', 'taker_buy_quote_volume',
+    'best_bid_price', 'best_bid_qty', 'best_ask_price', 'best_ask_qty',
+    'original_quantity', 'average_price', 'last_fill_quantity', 'accumulated_fill_quantity',
+    'percentage', 'depth', 'notional',
+    'sum_open_interest', 'sum_open_interest_value', 'count_toptrader_long_short_ratio', 'sum_toptrader_long_short_ratio',
+    'count_long_short_ratio', 'sum_taker_long_short_vol_ratio',
+    'index_value', 'strike', 'volume_contracts', 'volume_usdt', 'best_buy_iv', 'best_sell_iv', 'mark_price', 'mark_iv',
+    'delta', 'gamma', 'vega', 'theta', 'openinterest_contracts', 'openinterest_usdt',
+]
+_INT_COLUMNS = ['agg_trade_id', 'first_trade_id', 'last_trade_id', 'id', 'count', 'update_id', *TIME_COLUMNS]
+_BOOL_COLUMNS = ['is_buyer_maker', 'is_best_match']
+
+ARROW_COLUMN_TYPES = {
+    **{col: pa.float64() for col in _FLOAT_COLUMNS},
+    **{col: pa.int64() for col in _INT_COLUMNS},
+    **{col: pa.bool_() for col in _BOOL_COLUMNS},
+    **{col: pa.timestamp("ns") for col in TIMESTAMP_COLUMNS + DATE_COLUMNS},
+}
+
+ARROW_CONVERT_OPTIONS = pacsv.ConvertOptions(column_types=ARROW_COLUMN_TYPES)
+
+
+def _is_header_line(line: bytes) -> bool:
+    """
+    Return True if the first line of a CSV file is a header, i.e. none of its fields is numeric.
+    """
+
+    for field in line.decode().strip().split(","):
+        try:
+            float(field)
+            return False
+        except ValueError:
+            continue
+    return True
+
 BINANCE_SYNCER_CONFIG_DICT = {
     'LOCAL': {
         "PATH": f"{Path.home()}/binance-vision"
@@ -27,12 +89,119 @@ BINANCE_SYNCER_CONFIG_DICT = {
         "MAX_CONCURRENT_DOWNLOADS": 100,
         "SYMBOL_CONCURRENCY": 10,
         "BATCH_SIZE_SYNC": 20,
-        "BATCH_SIZE_DELETE": 1000
+        "BATCH_SIZE_DELETE": 1000,
+        "PARQUET_COMPRESSION": "zstd"
         }
 }
 
 Config.ensure_initialized("binance_syncer", BINANCE_SYNCER_CONFIG_DICT)
 
+# Settings added after the first release may be missing from an existing config file
+PARQUET_COMPRESSION = Config.BINANCE_SYNCER.SETTINGS.get("PARQUET_COMPRESSION", "zstd").lower()
+
+
+def _zip_to_parquet_bytes(raw: bytes, columns: Optional[tuple]) -> Optional[bytes]:
+    """
+    Convert a downloaded Binance zip archive into parquet bytes.
+    Runs in the conversion worker pool (see Syncer.download_and_store): zlib inflation and the pyarrow CSV reader
+    and parquet writer release the GIL, so several files are converted in parallel off the event loop.
+    Parameters:
+        raw (bytes): The zip archive as downloaded.
+        columns (Optional[tuple]): The column names from SCHEMA, or None to read them from the CSV header.
+    Returns:
+        Optional[bytes]: The parquet file content, or None if the archive holds no rows.
+    """
+
+    with ZipFile(BytesIO(raw)) as zf:
+        # Binance archives hold a single CSV: open it by its ZipInfo, the file object is streamed to the CSV reader
+        with zf.open(zf.infolist()[0]) as f:
+
+            # Read CSV into an Arrow table (with appropriate headers)
+            if columns is not None:
+                # Check if file has content
+                first_line = f.readline()
+                if not first_line:
+                    return None
+                
+                f.seek(0)  # Reset file pointer
+
+                read_options = pacsv.ReadOptions(column_names=columns, skip_rows=1 if _is_header_line(first_line) else 0)
+                table = pacsv.read_csv(f, read_options=read_options, convert_options=ARROW_CONVERT_OPTIONS)
+            else:
+                table = pacsv.read_csv(f, convert_options=ARROW_CONVERT_OPTIONS)
+
+    if table.num_rows == 0:
+        return None
+
+    # Convert epoch time columns (timestamp and date columns are parsed by the CSV reader).
+    # The unit (ms/us) is guessed from the first value, then the whole column is cast at the Arrow layer;
+    # the result is stored in ns as before so that old and new files share the same schema.
+    for i, col in enumerate(table.column_names):
+        if col in TIME_COLUMNS:
+            values = table.column(i).drop_null()
+            if len(values) == 0:
+                table = table.set_column(i, col, table.column(i).cast(pa.timestamp("ns")))
+                continue
+            unit = epoch_unit(values[0].as_py())
+            table = table.set_column(i, col, pc.cast(pc.cast(table.column(i), pa.timestamp(unit)), pa.timestamp("ns")))
+
+    # Binance files are sorted by time: declare it so readers can prune row groups on the footer statistics
+    sorting_columns = None
+    if "open_time" in table.column_names:
+        sorting_columns = [pq.SortingColumn(table.column_names.index("open_time"))]
+
+    out = BytesIO()
+    pq.write_table(
+        table,
+        out,
+        compression=PARQUET_COMPRESSION,
+        compression_level=1 if PARQUET_COMPRESSION == "zstd" else None,
+        use_dictionary=True,
+        write_statistics=True,
+        row_group_size=1_000_000,
+        data_page_size=1 << 20,
+        sorting_columns=sorting_columns,
+    )
+    return out.getvalue()
+
+
+@lru_cache(maxsize=None)
+def _shared_ssl_context(insecure: bool) -> ssl.SSLContext:
+    """
+    Build the SSL context used by the syncers. Loading the certifi CA bundle parses a few hundred kB of PEM,
+    so this is done once per process rather than once per Syncer.
+    Parameters:
+        insecure (bool): Disable certificate and hostname verification.
+    Returns:
+        ssl.SSLContext: The SSL context.
+    """
+
+    ssl_context = ssl.create_default_context(cafile=certifi.where())
+    logger.debug(f"Using certifi SSL context: {certifi.where()}")
+
+    if insecure:
+        logger.warning("BINANCE_SYNCER_INSECURE_SSL=1: SSL certificate verification is disabled")
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    return ssl_context
+
+
+def _unlink(path: Path) -> bool:
+    """
+    Remove a file, ignoring it if it is already gone.
+    Parameters:
+        path (Path): The file to remove.
+    Returns:
+        bool: True if the file was removed, False if it did not exist.
+    """
+
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
 
 class Syncer:
 
@@ -40,13 +209,23 @@ class Syncer:
     S3_PREFIX = Config.BINANCE_SYNCER.S3.PREFIX
     S3_BUCKET = Config.BINANCE_SYNCER.S3.BUCKET
 
-    MAX_CONCURRENT_TASKS = int(Config.BINANCE_SYNCER.SETTINGS.MAX_CONCURRENT_DOWNLOADS)        # download/convert concurrency per symbol
+    MAX_CONCURRENT_TASKS = int(Config.BINANCE_SYNCER.SETTINGS.MAX_CONCURRENT_DOWNLOADS)        # download/convert concurrency across all symbols
     SYMBOL_CONCURRENCY = int(Config.BINANCE_SYNCER.SETTINGS.SYMBOL_CONCURRENCY)                # number of symbols processed in parallel
-    BATCH_SIZE_SYNC = int(Config.BINANCE_SYNCER.SETTINGS.BATCH_SIZE_SYNC)                      # number of files processed in a batch
+    BATCH_SIZE_SYNC = int(Config.BINANCE_SYNCER.SETTINGS.BATCH_SIZE_SYNC)                      # number of downloads between two progress logs
     BATCH_SIZE_DELETE = int(Config.BINANCE_SYNCER.SETTINGS.BATCH_SIZE_DELETE)                  # number of files processed in a batch
 
+    LISTING_TIMEOUT = aiohttp.ClientTimeout(total=60)
+    DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=30, sock_read=120)
+
+    S3_MULTIPART_THRESHOLD = 8 * 1024 * 1024                                                    # files above this size are uploaded in parts
+    LOCAL_DELETE_CHUNK = 512                                                                    # local files unlinked concurrently
+
+    LISTING_CACHE_DIR = Path("~/.cache/binance-syncer").expanduser()                            # on-disk cache of the remote file listings
+    DAILY_LISTING_TTL = 3600                                                                    # seconds a daily listing is reused
+
     def __init__(self, market_type: MarketType, data_type: DataType, 
-                    interval: KlineInterval = None, progress: bool = False, s3: bool = False):
+                    interval: KlineInterval = None, progress: bool = False, s3: bool = False,
+                    listing_cache: bool = True):
             """
             Initialize the BinanceDataSync object.
             This method sets up the instance with the provided configuration parameters and
@@ -60,16 +239,32 @@ class Syncer:
                 progress (bool, optional): Flag indicating whether to display progress during operation.
                                             Defaults to False.
                 s3 (bool, optional): Flag indicating whether to use S3 for storage. Defaults to False.
+                listing_cache (bool, optional): Flag indicating whether to cache the remote file listings on disk
+                                            (see list_remote_files()). Defaults to True.
             """
         
             self.market_type = market_type
             self.data_type = data_type
             self.interval = interval
             self.progress = progress
+            self.listing_cache = listing_cache
             self.path_builder = BinancePathBuilder(market_type, data_type, interval)
+
+            # CSV column names, resolved once instead of per downloaded file
+            self._columns = SCHEMA.get(market_type, {}).get(data_type, None)
             
             # Configuration SSL robuste
             self._ssl_context = self._create_ssl_context()
+
+            # HTTP session shared by listings and downloads, and worker pool
+            # for the CSV -> parquet conversion, see _session_scope()
+            self._session = None
+            self._download_semaphore = None
+            self._cpu_pool = None
+            self._session_users = 0
+
+            # Remote symbols, listed once per syncer (see list_remote_symbols())
+            self._remote_symbols = None
             
             if s3:
                 import boto3
@@ -79,46 +274,213 @@ class Syncer:
 
     def _create_ssl_context(self):
         """
-        Creates and returns an SSL context with a robust fallback mechanism.
-        The method attempts to create a secure SSL context using certifi's CA bundle. If that fails,
-        it falls back to the system's default SSL context. If the system default also fails to create a usable
-        context, it finally resorts to a permissive SSL context with disabled hostname verification and certificate checks.
+        Returns the SSL context verifying certificates against certifi's CA bundle.
+        Certificate and hostname verification can only be disabled explicitly, by setting the
+        BINANCE_SYNCER_INSECURE_SSL=1 environment variable (e.g. behind an intercepting proxy).
+        The context is built once per process and shared by every syncer (see _shared_ssl_context()).
         Returns:
-            ssl.SSLContext: A configured SSL context object suitable for secure or fallback scenarios.
+            ssl.SSLContext: A configured SSL context object.
         """
 
-        import ssl
-        import certifi
-        
-        try:
-            # Try to use certifi for SSL context
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            logger.debug(f"Using certifi SSL context: {certifi.where()}")
-            return ssl_context
-        except Exception as e:
-            logger.warning(f"Certifi SSL failed: {e}, trying system certificates")
-            
-            try:
-                # Fallback to system SSL context
-                ssl_context = ssl.create_default_context()
-                return ssl_context
-            except Exception as e2:
-                logger.warning(f"System SSL failed: {e2}, using permissive SSL")
-                
-                # Fallback to permissive SSL context
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
-                return ssl_context
+        return _shared_ssl_context(os.environ.get("BINANCE_SYNCER_INSECURE_SSL") == "1")
             
+    async def __aenter__(self):
+        """
+        Open the HTTP session shared by every listing and download, the download semaphore shared by every symbol,
+        and the conversion worker pool, until the context exits.
+        """
+
+        self._session_users += 1
+        if self._session is None:
+            self._session = self._create_session()
+            # One gate for every download: symbols synced in parallel share the connector's capacity
+            self._download_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TASKS)
+            self._cpu_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="binance-syncer-convert")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._session_users -= 1
+        if self._session_users == 0:
+            await self._session.close()
+            self._cpu_pool.shutdown()
+            self._session = None
+            self._download_semaphore = None
+            self._cpu_pool = None
+
+    def _create_session(self) -> aiohttp.ClientSession:
+        """
+        Create the HTTP session used for all requests to the Binance bucket.
+        A single connector keeps TLS connections alive across listings, downloads and symbols,
+        so the handshake to data.binance.vision is paid once per connection instead of once per call.
+        Nagle's algorithm needs no tuning here: aiohttp sets TCP_NODELAY on every connection it opens.
+        Returns:
+            aiohttp.ClientSession: The configured session.
+        """
+
+        connector = aiohttp.TCPConnector(
+            ssl=self._ssl_context,
+            limit=self.MAX_CONCURRENT_TASKS,
+            limit_per_host=self.MAX_CONCURRENT_TASKS,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True,
+            # Keep the bucket host resolved for 5 minutes instead of aiohttp's 10 s default
+            use_dns_cache=True,
+            ttl_dns_cache=300
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.DOWNLOAD_TIMEOUT)
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        """
+        Yield the shared HTTP session (the worker pool is opened alongside it).
+        When the syncer is not used as an async context manager, the session is opened by the outermost
+        call and closed once the last concurrent call using it returns.
+        """
+
+        await self.__aenter__()
+        try:
+            yield self._session
+        finally:
+            await self.__aexit__(None, None, None)
+
+    @staticmethod
+    def _parse_listing_page(xml: bytes) -> dict:
+        """
+        Parse one ListObjectsV2 result page into plain Python values.
+        The page is streamed with ElementTree.iterparse and elements are cleared as soon as their text is read.
+        Parameters:
+            xml (bytes): The raw XML body returned by the S3 endpoint.
+        Returns:
+            dict: A dictionary with the following keys:
+                  "CommonPrefixes": list of prefix strings (only when a delimiter was used).
+                  "Contents": list of object keys.
+                  "NextContinuationToken": token of the next page, or None on the last page.
+        """
+
+        page = {"CommonPrefixes": [], "Contents": [], "NextContinuationToken": None}
+        truncated = False
+        for _, elem in ET.iterparse(BytesIO(xml), events=("end",)):
+            tag = elem.tag
+            if tag == S3_NS + "Contents":
+                page["Contents"].append(elem.findtext(S3_NS + "Key"))
+                elem.clear()
+            elif tag == S3_NS + "CommonPrefixes":
+                page["CommonPrefixes"].append(elem.findtext(S3_NS + "Prefix"))
+                elem.clear()
+            elif tag == S3_NS + "IsTruncated":
+                truncated = (elem.text or "").lower() == "true"
+            elif tag == S3_NS + "NextContinuationToken":
+                page["NextContinuationToken"] = elem.text
+        if not truncated:
+            page["NextContinuationToken"] = None
+        return page
+
+    @staticmethod
+    def _peek_continuation_token(xml: bytes) -> Optional[str]:
+        """
+        Read the continuation token of a ListObjectsV2 page without building the listed keys.
+        S3 usually emits IsTruncated and NextContinuationToken before the Contents, but the order is not
+        guaranteed: the scan goes on until both are known (or the page is not truncated), up to the end
+        of the page, clearing the entries as it goes.
+        Parameters:
+            xml (bytes): The raw XML body returned by the S3 endpoint.
+        Returns:
+            Optional[str]: The token of the next page, or None if the page is the last one.
+        """
+
+        token = None
+        truncated = None
+        for _, elem in ET.iterparse(BytesIO(xml), events=("end",)):
+            tag = elem.tag
+            if tag == S3_NS + "NextContinuationToken":
+                token = elem.text
+            elif tag == S3_NS + "IsTruncated":
+                truncated = (elem.text or "").lower() == "true"
+                if not truncated:
+                    return None
+            elif tag == S3_NS + "Contents" or tag == S3_NS + "CommonPrefixes":
+                elem.clear()
+                continue
+            if truncated and token is not None:
+                return token
+        return token if truncated else None
+
+    async def _fetch_listing_page(self, session: aiohttp.ClientSession, listing_url: str, token: Optional[str]) -> Optional[bytes]:
+        """
+        Asynchronously fetch the raw XML body of one ListObjectsV2 page.
+        Parameters:
+            session (aiohttp.ClientSession): The HTTP session used for the listing request.
+            listing_url (str): The listing URL as built by the path builder (ending with the prefix).
+            token (Optional[str]): The continuation token of the page, None for the first page.
+        Returns:
+            Optional[bytes]: The XML body, or None if the request did not succeed.
+        """
+
+        # Symbols are not restricted to ASCII (e.g. futures/um 币安人生USDT): percent-encode the prefix
+        url = quote(listing_url, safe=":/?=&") + "&list-type=2&delimiter=/&max-keys=1000"
+        if token:
+            url += f"&continuation-token={quote(token, safe='')}"
+
+        logger.debug(f"Fetching listing page: {url}")
+        # The URL is fully percent-encoded above: skip yarl's parsing and requoting
+        async with session.get(URL(url, encoded=True), timeout=self.LISTING_TIMEOUT) as resp:
+            if resp.status != 200:
+                logger.warning(f"Listing failed for {listing_url} status {resp.status}")
+                return None
+            return await resp.read()
+
+    async def _iter_listing_pages(self, session: aiohttp.ClientSession, listing_url: str, status: Optional[dict] = None):
+        """
+        Asynchronously iterate over the pages of a public bucket listing using the ListObjectsV2 API.
+        Pages are pipelined: as soon as the continuation token is read from the header of page k, the request
+        for page k+1 is sent, and page k is parsed in a worker thread while that request is in flight.
+        At most one page is prefetched ahead of the consumer.
+        Parameters:
+            session (aiohttp.ClientSession): The HTTP session used for the listing requests.
+            listing_url (str): The listing URL as built by the path builder (ending with the prefix).
+            status (Optional[dict]): If given, status["complete"] is set to True once the last page (no continuation
+                token) has been read, and stays False if a page request failed.
+        Yields:
+            dict: The parsed page, see _parse_listing_page().
+        """
+
+        if status is not None:
+            status["complete"] = False
+        pending = asyncio.ensure_future(self._fetch_listing_page(session, listing_url, None))
+        try:
+            while pending is not None:
+                xml = await pending
+                pending = None
+                if xml is None:
+                    return
+
+                token = self._peek_continuation_token(xml)
+                if token:
+                    pending = asyncio.ensure_future(self._fetch_listing_page(session, listing_url, token))
+
+                page = await asyncio.to_thread(self._parse_listing_page, xml)
+
+                # Reconcile the prefetched page with the token of the fully parsed page
+                next_token = page["NextContinuationToken"]
+                if next_token != token:
+                    if pending is not None:
+                        pending.cancel()
+                    pending = asyncio.ensure_future(self._fetch_listing_page(session, listing_url, next_token)) if next_token else None
+
+                if pending is None and status is not None:
+                    status["complete"] = True
+                yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
     async def list_remote_symbols(self) -> list[str]:
         """
         Asynchronously fetch and return a sorted list of unique remote symbols.
-        The function makes paginated HTTP GET requests to a remote endpoint to retrieve XML listings of symbols.
-        It continues fetching pages until there are no more pages left (i.e., the response indicates it is not truncated).
-        Each symbol is extracted from the XML response by finding the "s3:Prefix" element within each "s3:CommonPrefixes" element.
-        If the response is truncated, a marker is updated to fetch the next page.
+        The symbols are the "CommonPrefixes" of the data type directory, listed page by page with
+        _iter_listing_pages() until S3 stops returning a continuation token.
         The resulting symbols are deduplicated, sorted, and returned as a list.
+        The listing is done once per syncer, later calls (e.g. a dry run then a sync) reuse it.
         Returns:
             list[str]: A sorted list of unique symbol strings retrieved from the remote server.
         Raises:
@@ -126,54 +488,36 @@ class Syncer:
             Exception: For any other unexpected errors that occur during the data retrieval process.
         """
         
-        symbols, marker = [], None
-        ns = {'s3': 'http://s3.amazonaws.com/doc/2006-03-01/'}
+        if self._remote_symbols is not None:
+            return list(self._remote_symbols)
 
-        # Use the predefined SSL context
-        connector = aiohttp.TCPConnector(ssl=self._ssl_context)
-        timeout = aiohttp.ClientTimeout(total=60)
-        
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            while True:
-                url = self.path_builder.build_listing_symbols_path() + "/&delimiter=/&max-keys=1000"
-                if marker:
-                    url += f"&marker={marker}"
-                
-                try:
-                    logger.debug(f"Fetching symbols from: {url}")
-                    resp = await session.get(url)
-                    if resp.status != 200:
-                        logger.warning(f"List symbols failed status {resp.status}")
-                        break
-                        
-                    xml = await resp.text()
-                    root = ET.fromstring(xml)
-                    for p in root.findall("s3:CommonPrefixes", ns):
-                        sym = p.find("s3:Prefix", ns).text.split(self.data_type.value)[-1].strip("/")
+        symbols = []
+
+        async with self._session_scope() as session:
+            try:
+                listing_url = self.path_builder.build_listing_symbols_path() + "/"
+                async for page in self._iter_listing_pages(session, listing_url):
+                    for prefix in page["CommonPrefixes"]:
+                        sym = prefix.split(self.data_type.value)[-1].strip("/")
                         if sym:
                             symbols.append(sym)
-                            
-                    if root.find("s3:IsTruncated", ns) is not None and root.find("s3:IsTruncated", ns).text.lower() == "true":
-                        next_marker = root.find("s3:NextMarker", ns)
-                        marker = next_marker.text if next_marker is not None else symbols[-1]
-                    else:
-                        break
-                        
-                except aiohttp.ClientError as e:
-                    logger.error(f"HTTP error while listing symbols: {e}")
-                    raise
-                except Exception as e:
-                    logger.error(f"Unexpected error while listing symbols: {e}")
-                    raise
+
+            except aiohttp.ClientError as e:
+                logger.error(f"HTTP error while listing symbols: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error while listing symbols: {e}")
+                raise
                     
-        return list(sorted(set(symbols)))
+        self._remote_symbols = sorted(set(symbols))
+        return list(self._remote_symbols)
 
     def list_local_dates(self, symbol: str) -> set[str]:
         """
         List available date identifiers from local storage or S3 for a given symbol.
         This function retrieves the dates for which data is available by either querying an S3 bucket or scanning a local directory. 
         For S3 storage, it uses a paginator to list objects with a specified prefix and extracts the date from each object's key. 
-        For local storage, it scans the directory for files with a ".parquet" extension and extracts the stem (filename without extension).
+        For local storage, it scans the directory (os.scandir, run in a worker thread by compute_dates_cover) for files with a ".parquet" extension and extracts the stem (filename without extension).
         Parameters:
             symbol (str): The trading symbol for which to list the available data dates.
         Returns:
@@ -189,8 +533,15 @@ class Syncer:
                     existing.add(Path(obj["Key"]).stem)
         else:
             prefix = self.path_builder.build_save_path(self.LOCAL_PREFIX, symbol)
-            path = Path(prefix)
-            existing = {f.stem for f in path.glob("*.parquet") if f.is_file()}
+            # scandir gets the file type from the directory entry, no stat call per file
+            try:
+                with os.scandir(prefix) as it:
+                    existing = {
+                        entry.name[:-len(".parquet")] for entry in it
+                        if entry.name.endswith(".parquet") and entry.is_file(follow_symlinks=False)
+                    }
+            except FileNotFoundError:
+                existing = set()
         return existing
     
     async def compute_dates_cover(self, symbol: str):
@@ -208,108 +559,170 @@ class Syncer:
                   "D_RM": A set of day strings (formatted as "YYYY-MM-DD") representing local daily data dates that should be
                           removed because their corresponding month has remote monthly data available.
         Description:
-            The function starts by listing local dates and dividing them into monthly (length 7) and daily (length 10)
-            collections. Then, it asynchronously retrieves remote file lists for both monthly and daily frequencies and
-            extracts the corresponding date parts from the file names. The comparisons between the local and remote dates
-            determine which dates are missing and which local days should be removed when their monthly data is present
-            remotely.
+            The local dates and the remote monthly and daily files are retrieved concurrently (see _list_dates()).
+            The comparisons between the local and remote dates determine which dates are missing and which local days
+            should be removed when their monthly data is present remotely.
         Raises:
             Exceptions originating from self.list_local_dates or self.list_remote_files may be raised in case of errors
             during file retrieval or processing.
         """
-        
-        local_dates = self.list_local_dates(symbol)
-        local_months = {d for d in local_dates if len(d) == 7}
-        local_days = {d for d in local_dates if len(d) == 10}
 
-        remote_months_files = await self.list_remote_files(Frequency.MONTHLY, symbol)
-        remote_months = {'-'.join(file.split('/')[-1].replace('.zip', '').split('-')[2:]) for file in remote_months_files}
+        local_dates, remote_months, remote_days = await self._list_dates(symbol)
+        return self._dates_cover(local_dates, remote_months.keys(), remote_days.keys())
+
+    async def _list_dates(self, symbol: str) -> tuple:
+        """
+        List the local dates (in a worker thread) and the remote monthly and daily files of a symbol concurrently.
+        Parameters:
+            symbol (str): The trading symbol.
+        Returns:
+            tuple: The local dates (set[str]), and the remote monthly and daily files (dict[str, str], date -> file key).
+        """
 
-        remote_days_files = await self.list_remote_files(Frequency.DAILY, symbol)
-        remote_days = {'-'.join(file.split('/')[-1].replace('.zip', '').split('-')[2:]) for file in remote_days_files}
+        return await asyncio.gather(
+            asyncio.to_thread(self.list_local_dates, symbol),
+            self.list_remote_files(Frequency.MONTHLY, symbol),
+            self.list_remote_files(Frequency.DAILY, symbol),
+        )
+
+    @staticmethod
+    def _dates_cover(local_dates: set[str], remote_months, remote_days) -> dict:
+        """
+        Compute the months/days to download and the local days to remove from the local and remote date sets.
+        Parameters:
+            local_dates (set[str]): Local date identifiers, months ("YYYY-MM") and days ("YYYY-MM-DD") mixed.
+            remote_months (set-like of str): Months available remotely as monthly files.
+            remote_days (set-like of str): Days available remotely as daily files.
+        Returns:
+            dict: The "M_DL", "D_DL" and "D_RM" sets, see compute_dates_cover().
+        """
+
+        local_months = {d for d in local_dates if len(d) == 7}
+        local_days = {d for d in local_dates if len(d) == 10}
 
         days_to_remove = {d for d in local_days if d[:7] in remote_months}
         days_to_have = {d for d in remote_days if d[:7] not in remote_months}
 
-        return {"M_DL": remote_months - local_months, "D_DL": days_to_have - local_days, "D_RM": days_to_remove}
+        return {"M_DL": set(remote_months - local_months), "D_DL": days_to_have - local_days, "D_RM": days_to_remove}
 
-    async def list_remote_files(self, frequency: Frequency, symbol: str) -> list[str]:
+    async def list_remote_files(self, frequency: Frequency, symbol: str) -> dict[str, str]:
         """
-        Asynchronously retrieves a list of remote file keys for a specified frequency and symbol from a remote S3-style service.
-        This method builds the request URL for listing files and iteratively fetches paginated XML-formatted responses. It extracts and
-        collects file keys that end with ".zip" (excluding those ending with ".zip.CHECKSUM"). If the response indicates that the listing is
-        truncated, it uses the last file's key as a marker to continue retrieving additional files.
+        Asynchronously retrieves the remote file keys for a specified frequency and symbol from a remote S3-style service.
+        This method lists the symbol directory page by page with _iter_listing_pages() and collects file keys that end
+        with ".zip" (excluding those ending with ".zip.CHECKSUM"), indexed by the date found in their name.
+        Unless listing_cache is disabled, the result is cached under LISTING_CACHE_DIR and reused while it is
+        up to date (see _read_listing_cache()).
         Parameters:
             frequency (Frequency): The frequency or interval defining the range of files to list.
             symbol (str): The symbol identifier for which the remote files are to be fetched.
         Returns:
-            list[str]: A list of file keys that match the specified criteria.
+            dict[str, str]: The matching file keys, by date ("YYYY-MM" or "YYYY-MM-DD").
         Raises:
             aiohttp.ClientError: If an HTTP-related error occurs while making the request.
             Exception: If any unexpected error occurs during processing.
         """
 
-        files, marker = [], None
-        ns = {'s3': 'http://s3.amazonaws.com/doc/2006-03-01/'}
-        
-        # Use the predefined SSL context
-        connector = aiohttp.TCPConnector(ssl=self._ssl_context)
-        timeout = aiohttp.ClientTimeout(total=60)
+        cache_path = self._listing_cache_path(frequency, symbol) if self.listing_cache else None
+        if cache_path is not None:
+            files = await asyncio.to_thread(self._read_listing_cache, cache_path, frequency)
+            if files is not None:
+                logger.debug(f"Using cached {frequency.value} listing for {symbol}")
+                return files
+
+        files = {}
+        status = {"complete": False}
         
-        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
-            while True:
-                url = self.path_builder.build_listing_files_path(frequency, symbol)
-                if marker:
-                    url += f"&marker={marker}"
-                    
-                try:
-                    resp = await session.get(url)
-                    if resp.status != 200:
-                        logger.warning(f"Listing dates failed for {symbol} status {resp.status}")
-                        break
-                        
-                    xml = await resp.text()
-                    root = ET.fromstring(xml)
-                    contents = root.findall("s3:Contents", ns)
-                    if not contents:
-                        break
-                        
-                    for c in contents:
-                        key = c.find("s3:Key", ns).text
-                        if key.endswith(".zip") and not key.endswith(".zip.CHECKSUM"):
-                            files.append(key)
-                            
-                    if root.find("s3:IsTruncated", ns) is not None and root.find("s3:IsTruncated", ns).text.lower() == "true":
-                        marker = contents[-1].find("s3:Key", ns).text
-                    else:
-                        break
-                        
-                except aiohttp.ClientError as e:
-                    logger.error(f"HTTP error while listing files for {symbol}: {e}")
-                    raise
-                except Exception as e:
-                    logger.error(f"Unexpected error while listing files for {symbol}: {e}")
-                    raise
+        async with self._session_scope() as session:
+            try:
+                # Trailing slash so that e.g. BTCUSD does not also match BTCUSDT
+                listing_url = self.path_builder.build_listing_files_path(frequency, symbol) + "/"
+                async for page in self._iter_listing_pages(session, listing_url, status):
+                    for key in page["Contents"]:
+                        match = _DATE_KEY_RE.search(key)
+                        if match is not None:
+                            files[match.group(1)] = key
+
+            except aiohttp.ClientError as e:
+                logger.error(f"HTTP error while listing files for {symbol}: {e}")
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error while listing files for {symbol}: {e}")
+                raise
+
+        if not status["complete"]:
+            # A failed page ends the listing early: never cache it, the missing dates would go unnoticed
+            logger.warning(f"Incomplete {frequency.value} listing for {symbol} ({len(files)} files), not cached")
+        elif cache_path is not None:
+            await asyncio.to_thread(self._write_listing_cache, cache_path, files)
                     
         return files
 
+    def _listing_cache_path(self, frequency: Frequency, symbol: str) -> Path:
+        """
+        Return the cache file of the remote listing of a symbol, one per market, data type, interval and frequency.
+        """
+
+        parts = [self.market_type.value, self.data_type.value]
+        if self.interval is not None:
+            parts.append(self.interval.value)
+        parts += [symbol, frequency.value]
+        return self.LISTING_CACHE_DIR / f"{'_'.join(parts).replace('/', '-')}.json"
+
+    def _read_listing_cache(self, path: Path, frequency: Frequency) -> Optional[dict]:
+        """
+        Read a cached remote listing if it is still up to date.
+        Monthly archives of past months never change: a monthly listing is complete as long as it holds the
+        previous month, the next archive cannot appear before the next month. Daily listings are reused for
+        DAILY_LISTING_TTL seconds.
+        Parameters:
+            path (Path): The cache file.
+            frequency (Frequency): The frequency of the listing.
+        Returns:
+            Optional[dict]: The cached date -> file key mapping, or None if it is missing or outdated.
+        """
+
+        try:
+            if frequency == Frequency.DAILY and time.time() - path.stat().st_mtime > self.DAILY_LISTING_TTL:
+                return None
+            files = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if frequency == Frequency.MONTHLY:
+            previous_month = (datetime.now(timezone.utc).replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+            if previous_month not in files:
+                return None
+        return files
+
+    @staticmethod
+    def _write_listing_cache(path: Path, files: dict):
+        """
+        Write a remote listing to the cache; failures only disable the cache for this listing.
+        """
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(files))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write listing cache {path}: {e}")
+
     async def sync_symbol(self, symbol: str):
         """
         Synchronize data for the given symbol by downloading missing and removing outdated files.
         This asynchronous method performs the following steps:
         1. Logs the initiation of the synchronization process for the provided symbol.
-        2. Computes the dates that require data coverage (both for download and removal) using compute_dates_cover().
+        2. Computes the dates that require data coverage (both for download and removal), as compute_dates_cover() does.
         3. If there are no dates requiring action, logs that the symbol is up-to-date and returns early.
         4. Logs the number of months and days to download as well as the number of days to remove.
-        5. Constructs download paths for monthly and daily data files to be fetched.
+        5. Builds the download URLs of the monthly and daily data files to be fetched from their listed keys.
         6. If there are files to remove:
-            - Removes files from S3 if the storage mode is set to 's3' using batch_delete_s3().
-            - Otherwise, deletes files asynchronously using delete_files_async().
+            - Deletes them with delete_files_async() (batched S3 requests, or local unlinks in worker threads).
         7. If there are files to download:
-            - Sets up an aiohttp ClientSession with specified SSL, timeout, and connection parameters.
-            - Processes downloads in batches, limiting concurrent downloads with a semaphore.
-            - For each batch, schedules download_and_store tasks and awaits their completion.
-            - Logs the success rate for each batch and warns if any downloads failed.
+            - Reuses the shared aiohttp ClientSession (see _session_scope()).
+            - Schedules a download_and_store task per file at once, limiting concurrent downloads with the semaphore shared by all symbols.
+            - Collects the tasks as they complete, logs the progress every BATCH_SIZE_SYNC files and warns if any downloads failed.
         Parameters:
              symbol (str): The symbol for which the data synchronization is performed.
         Returns:
@@ -317,7 +730,8 @@ class Syncer:
         """
 
         logger.info(f"=== Syncing {symbol} ===")
-        dates_dict = await self.compute_dates_cover(symbol)
+        local_dates, remote_months, remote_days = await self._list_dates(symbol)
+        dates_dict = self._dates_cover(local_dates, remote_months.keys(), remote_days.keys())
         
         if not any(dates_dict.values()):
             logger.info(f"{symbol} is up-to-date")
@@ -327,61 +741,42 @@ class Syncer:
                     f"{len(dates_dict['D_DL'])} days to download, "
                     f"{len(dates_dict['D_RM'])} days to remove")
         
-        to_fetch = []
-        for date in dates_dict['M_DL']:
-            date_parts = date.split('-')
-            to_fetch.append(self.path_builder.build_download_path(
-                Frequency.MONTHLY, symbol, *date_parts))
-        
-        for date in dates_dict['D_DL']:
-            date_parts = date.split('-')
-            to_fetch.append(self.path_builder.build_download_path(
-                Frequency.DAILY, symbol, *date_parts))
+        # Download URLs straight from the listed keys
+        to_fetch = [f"{BASE_URL}/{remote_months[date]}" for date in dates_dict['M_DL']]
+        to_fetch += [f"{BASE_URL}/{remote_days[date]}" for date in dates_dict['D_DL']]
 
         if dates_dict['D_RM']:
-            if self.s3 is not None:
-                await self.batch_delete_s3(list(dates_dict['D_RM']), symbol)
-            else:
-                delete_semaphore = asyncio.Semaphore(20)
-                await self.delete_files_async(list(dates_dict['D_RM']), symbol, delete_semaphore)
+            await self.delete_files_async(list(dates_dict['D_RM']), symbol)
         
         # Download new files
         if to_fetch:
-            download_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TASKS // 2)
-            
-            connector = aiohttp.TCPConnector(
-                ssl=self._ssl_context,
-                limit=100,
-                limit_per_host=20,
-                keepalive_timeout=30,
-                enable_cleanup_closed=True
-            )
-            
-            timeout = aiohttp.ClientTimeout(
-                total=300,
-                connect=30,
-                sock_read=120
-            )
-            
-            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as sess:
-                
-                for i in range(0, len(to_fetch), self.BATCH_SIZE_SYNC):
-                    batch_urls = to_fetch[i:i + self.BATCH_SIZE_SYNC]
-                    
-                    batch_tasks = [
-                        self.download_and_store(sess, symbol, url, download_semaphore) 
-                        for url in batch_urls
-                    ]
-                    
-                    results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-                    
-                    success_count = sum(1 for r in results if r is True)
-                    failed_count = len(batch_tasks) - success_count
-                    
-                    logger.info(f"{symbol}: Batch {i//self.BATCH_SIZE_SYNC + 1}/{(len(to_fetch) + self.BATCH_SIZE_SYNC - 1)//self.BATCH_SIZE_SYNC} - "
-                               f"{success_count}/{len(batch_tasks)} success")
-                    if failed_count > 0:
-                        logger.warning(f"{symbol}: {failed_count} downloads failed in this batch")
+            async with self._session_scope() as sess:
+                # Locals hoisted out of the per-file loops
+                download_and_store = self.download_and_store
+                download_semaphore = self._download_semaphore
+                log_every = self.BATCH_SIZE_SYNC
+
+                # Every download is issued at once, the shared semaphore is the only concurrency gate
+                tasks = [
+                    asyncio.create_task(download_and_store(sess, symbol, url, download_semaphore))
+                    for url in to_fetch
+                ]
+                total = len(tasks)
+
+                success_count = 0
+                for done, fut in enumerate(asyncio.as_completed(tasks), start=1):
+                    try:
+                        if await fut is True:
+                            success_count += 1
+                    except Exception as e:
+                        logger.error(f"{symbol}: download failed: {e}")
+
+                    if done % log_every == 0 or done == total:
+                        logger.info(f"{symbol}: {done}/{total} files processed - {success_count} success")
+
+                failed_count = total - success_count
+                if failed_count > 0:
+                    logger.warning(f"{symbol}: {failed_count} downloads failed")
 
     async def download_and_store(self, session: aiohttp.ClientSession, symbol: str,
                                 file_key: str, semaphore: asyncio.Semaphore, max_retries: int = 3) -> bool:
@@ -389,15 +784,15 @@ class Syncer:
         Downloads a zipped CSV file from the given file_key, processes its data, and stores it in either S3 or locally.
         This asynchronous function performs the following operations:
         1. Uses a semaphore to limit concurrent downloads.
-        2. Checks if the file (derived from file_key) already exists in S3 (if storage_mode is 's3') and skips downloading if it does.
-        3. Attempts to download the file using the provided aiohttp ClientSession.
-        4. Reads the downloaded zip file, extracts the contained CSV, and loads it into a pandas DataFrame.
-            - If the data type matches one of the predefined headers in Headers, the CSV is read without a header and the columns are set accordingly.
-            - In the case of KLINES data, specific timestamp columns ('open_time' and 'close_time') are parsed safely.
-        5. Depending on the storage_mode:
-            - For S3: Converts the DataFrame to parquet format and uploads it to the specified S3 bucket.
-            - For local storage: Saves the DataFrame as a parquet file to the local filesystem.
-        6. Implements exponential backoff and retries the download process up to max_retries times if any error occurs.
+        2. Attempts to download the file using the provided aiohttp ClientSession.
+        3. Converts the zip file to parquet in the worker pool (_zip_to_parquet_bytes): the contained CSV is parsed
+           straight into an Arrow table with pyarrow.csv.
+            - If the data type has a known schema in SCHEMA, the columns are named accordingly and a header line, if any, is skipped.
+            - Known columns get fixed Arrow types (ARROW_COLUMN_TYPES) and epoch time columns are converted to timestamps.
+        4. Depending on the storage_mode:
+            - For S3: Uploads the parquet bytes to the specified S3 bucket.
+            - For local storage: Writes the parquet bytes to the local filesystem.
+        5. Implements exponential backoff and retries the download process up to max_retries times if any error occurs.
         Parameters:
                 session (aiohttp.ClientSession): The HTTP session used for making asynchronous requests.
                 symbol (str): The trading symbol associated with the data.
@@ -408,83 +803,49 @@ class Syncer:
                 bool: True if the download and storage process completes successfully; otherwise, False.
         """
 
+        date_key = _DATE_KEY_RE.search(file_key).group(1)
         async with semaphore:
-            filename = f"{'-'.join(file_key.split('/')[-1].replace('.zip', '').split('-')[2:])}.parquet"
+            filename = f"{date_key}.parquet"
 
             if self.s3 is not None:
                 file_path = self.path_builder.build_save_path(self.S3_PREFIX, symbol, filename)
-                try:
-                    self.s3.head_object(Bucket=self.S3_BUCKET, Key=file_path)
-                    logger.debug(f"File already exists: {file_path}")
-                    return True
-                except self.s3.exceptions.ClientError as e:
-                    if e.response["Error"]["Code"] != "404":
-                        logger.error(f"Head object error {symbol} {file_path}: {e}")
-                        return False
 
             for attempt in range(max_retries + 1):
                 try:
-                    async with session.get(file_key) as resp:
+                    # Listed keys are raw (possibly non-ASCII) strings, percent-encode them once here
+                    async with session.get(URL(quote(file_key, safe=":/"), encoded=True)) as resp:
                         resp.raise_for_status()
-                        
-                        data = BytesIO()
-                        async for chunk in resp.content.iter_chunked(8192):
-                            data.write(chunk)
-                        
-                        data.seek(0)
-
-                        with ZipFile(data) as zf:
-                            with zf.open(zf.namelist()[0]) as f:
-
-                                # Read CSV into DataFrame (with appropriate headers)
-                                cols = SCHEMA.get(self.market_type, {}).get(self.data_type, None)
-                                if cols is not None:
-                                    # Check if file has content
-                                    first_line = f.readline()
-                                    if not first_line:
-                                        logger.warning(f"Empty file: {file_key}")
-                                        return False
-                                    
-                                    f.seek(0)  # Reset file pointer
-                                    
-                                    header = pd.read_csv(f, header=None, nrows=1)
-                                    if len(header) > 0 and len(header.columns) > 0 and all(isinstance(x, str) for x in header.iloc[0]):
-                                        f.seek(0)
-                                        df = pd.read_csv(f, header=None, skiprows=1)
-                                    else:
-                                        f.seek(0)
-                                        df = pd.read_csv(f, header=None)
-                                    
-                                    if df.empty:
-                                        logger.warning(f"Empty dataframe after reading: {file_key}")
-                                        return False
-                                    
-                                    df.columns = cols
-                                else:
-                                    df = pd.read_csv(f)
-
-                                # Convert time columns
-                                for col in df.columns:
-                                    if col in TIMESTAMP_COLUMNS:
-                                        df[col] = pd.to_datetime(df[col], format="%Y-%m-%d %H:%M:%S")
-                                    elif col in DATE_COLUMNS:
-                                        df[col] = pd.to_datetime(df[col], format="%Y-%m-%d")
-                                    elif col in TIME_COLUMNS:
-                                        df[col] = safe_parse_time(df[col])
+                        # The archive has to be fully buffered for ZipFile anyway
+                        raw = await resp.read()
+
+                    # Unzip, parse and encode in the worker pool so the event loop keeps serving downloads
+                    parquet_bytes = await asyncio.get_running_loop().run_in_executor(
+                        self._cpu_pool, _zip_to_parquet_bytes, raw, self._columns
+                    )
+
+                    if parquet_bytes is None:
+                        logger.warning(f"Empty file: {file_key}")
+                        return False
                                     
-                                if self.s3 is not None:
-                                    out = BytesIO()
-                                    df.to_parquet(out, compression="snappy", index=False)
-                                    out.seek(0)
-                                    self.s3.upload_fileobj(out, self.S3_BUCKET, file_path)
-                                    logger.debug(f"Uploaded to S3: {file_path}")
-                                else:
-                                    local_path = Path(self.path_builder.build_save_path(self.LOCAL_PREFIX, symbol, filename))
-                                    local_path.parent.mkdir(parents=True, exist_ok=True)
-                                    df.to_parquet(local_path, compression="snappy", index=False)
-                                    logger.debug(f"Saved locally: {local_path}")
-                                
-                                return True
+                    if self.s3 is not None:
+                        # Small files go in a single PUT, bigger ones through boto3's parallel multipart transfer.
+                        # Both are blocking boto3 calls, run in a thread so the downloads keep flowing meanwhile.
+                        if len(parquet_bytes) < self.S3_MULTIPART_THRESHOLD:
+                            await asyncio.to_thread(
+                                self.s3.put_object, Bucket=self.S3_BUCKET, Key=file_path, Body=parquet_bytes
+                            )
+                        else:
+                            await asyncio.to_thread(
+                                self.s3.upload_fileobj, BytesIO(parquet_bytes), self.S3_BUCKET, file_path
+                            )
+                        logger.debug(f"Uploaded to S3: {file_path}")
+                    else:
+                        local_path = Path(self.path_builder.build_save_path(self.LOCAL_PREFIX, symbol, filename))
+                        local_path.parent.mkdir(parents=True, exist_ok=True)
+                        await asyncio.to_thread(local_path.write_bytes, parquet_bytes)
+                        logger.debug(f"Saved locally: {local_path}")
+                    
+                    return True
                                 
                 except Exception as e:
                     logger.warning(f"Download failed for {symbol} {file_key} (attempt {attempt + 1}/{max_retries + 1}): {e}")
@@ -500,7 +861,7 @@ class Syncer:
         Asynchronously deletes multiple S3 objects in batches.
         This method constructs S3 object keys based on the provided list of dates and symbol,
         using a path builder utility. It then deletes the objects in batches (up to 1000 per batch)
-        by calling the S3 client's delete_objects method. The method logs the number of successfully
+        by calling the S3 client's delete_objects method in a worker thread. The method logs the number of successfully
         deleted files for each batch and reports any errors encountered during deletion.
         Parameters:
             files_to_delete (list[str]): A list of date strings, each representing a file (without extension)
@@ -524,7 +885,8 @@ class Syncer:
         for i in range(0, len(delete_objects), self.BATCH_SIZE_DELETE):
             batch = delete_objects[i:i + self.BATCH_SIZE_DELETE]
             try:
-                response = self.s3.delete_objects(
+                response = await asyncio.to_thread(
+                    self.s3.delete_objects,
                     Bucket=self.S3_BUCKET,
                     Delete={'Objects': batch, 'Quiet': False}
                 )
@@ -537,68 +899,41 @@ class Syncer:
             except Exception as e:
                 logger.error(f"Batch delete failed for {symbol}: {e}")
             
-    async def delete_files_async(self, files_to_delete: list[str], symbol: str, semaphore: asyncio.Semaphore):
+    async def delete_files_async(self, files_to_delete: list[str], symbol: str):
         """
         Asynchronously deletes multiple files specified by file dates.
-        This function processes a list of file identifiers (typically representing dates)
-        and deletes each corresponding file concurrently. Depending on the storage_mode,
-        it either performs deletion on an S3 bucket or on the local filesystem.
+        Depending on the storage_mode, it either performs deletion on an S3 bucket or on the local filesystem.
         Parameters:
             files_to_delete (list[str]): A list of strings representing file identifiers 
                                          (e.g., dates) that will be appended to build the file paths.
             symbol (str): A symbol used to customize the file path for deletion.
-            semaphore (asyncio.Semaphore): A semaphore to limit the number of concurrent deletion 
-                                           operations, ensuring controlled access to the resources.
         Behavior:
             - If the storage_mode is 's3':
-                Constructs the remote file path using the S3_PREFIX, symbol, and file identifier.
-                It then attempts to asynchronously delete the object from the specified S3 bucket.
-                Errors during deletion are caught and logged.
+                The files are deleted with batch_delete_s3(), up to BATCH_SIZE_DELETE keys per request.
             - For local storage:
-                Constructs the local file path using the LOCAL_PREFIX, symbol, and file identifier.
-                If the file exists, it is deleted asynchronously using an executor to avoid blocking
-                the event loop.
-        All file deletion tasks are gathered and executed concurrently while handling any 
-        exceptions internally.
+                Constructs the local file paths using the LOCAL_PREFIX, symbol, and file identifier.
+                The files are unlinked in worker threads, LOCAL_DELETE_CHUNK at a time; missing files are ignored.
         """
 
-        async def delete_single_file(file_date: str):
-            """
-            Asynchronously deletes a file for a given date based on the storage mode.
-            This function determines whether to delete the file from an S3 bucket or from the local
-            filesystem by checking the 'storage_mode'. It uses an asynchronous semaphore to limit the
-            number of concurrent deletion operations.
-            Parameters:
-                file_date (str): The date string representing the file to be deleted. The file name is
-                                 constructed by appending '.parquet' to this string.
-            Raises:
-                Exception: Any exceptions raised during the deletion process (e.g., S3 deletion errors)
-                           are logged with an error message.
-            Notes:
-                - For S3 storage, the file path is built using a remote prefix and the corresponding
-                  symbol, then deletion is attempted via the asynchronous S3 deletion method.
-                - For local storage, the file path is built using a local prefix and the corresponding
-                  symbol. It checks the file's existence before performing an asynchronous deletion using
-                  an executor.
-            """
+        if self.s3 is not None:
+            await self.batch_delete_s3(files_to_delete, symbol)
+            return
 
-            async with semaphore:
-                if self.s3 is not None:
-                    file_path = self.path_builder.build_save_path(self.S3_PREFIX, symbol, f"{file_date}.parquet")
-                    try:
-                        await self.s3_async.delete_object(Bucket=self.S3_BUCKET, Key=file_path)
-                        logger.info(f"Deleted {file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting {file_path}: {e}")
-                else:
-                    local_path = Path(self.path_builder.build_save_path(self.LOCAL_PREFIX, symbol, f"{file_date}.parquet"))
-                    if local_path.exists():
-                        loop = asyncio.get_event_loop()
-                        await loop.run_in_executor(None, local_path.unlink)
-                        logger.info(f"Deleted {local_path}")
-        
-        tasks = [delete_single_file(date) for date in files_to_delete]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        local_paths = [
+            Path(self.path_builder.build_save_path(self.LOCAL_PREFIX, symbol, f"{date}.parquet"))
+            for date in files_to_delete
+        ]
+        for i in range(0, len(local_paths), self.LOCAL_DELETE_CHUNK):
+            chunk = local_paths[i:i + self.LOCAL_DELETE_CHUNK]
+            results = await asyncio.gather(
+                *(asyncio.to_thread(_unlink, path) for path in chunk),
+                return_exceptions=True
+            )
+            for path, result in zip(chunk, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error deleting {path}: {result}")
+                elif result:
+                    logger.info(f"Deleted {path}")
 
     async def sync(self, symbols: list[str] = None):
         """
@@ -607,42 +942,78 @@ class Syncer:
             symbols (list[str], optional): A list of symbols to be synchronized. If not provided, the method retrieves the symbols using the `list_remote_symbols` method.
         Behavior:
             - Logs the number of symbols along with market type, data type, and interval information.
-            - If progress tracking is enabled (via the `progress` attribute), displays a progress bar that updates as each batch of symbols is processed.
-            - Processes symbols in batches determined by the product of a concurrency constant (`SYMBOL_CONCURRENCY * 2`).
-            - Uses `asyncio.gather` to concurrently execute the `sync_symbol` method for each symbol in the current batch.
-            - If progress tracking is disabled, synchronizes symbols in batches and logs a completion message once done.
+            - If progress tracking is enabled (via the `progress` attribute) and the console is a terminal, displays a progress bar
+              that updates as each symbol completes. Otherwise the progress is logged every 5% of the symbols.
+            - Starts the `sync_symbol` method for every symbol at once with `asyncio.gather`, a semaphore keeping at most
+              `SYMBOL_CONCURRENCY * 2` of them running: a finished symbol is immediately replaced by the next one.
+            - A failing symbol does not stop the others: its error is logged and collected, and a summary is logged once done.
+            - Without the progress bar, logs a completion message once done.
         Returns:
             Coroutine: This asynchronous method completes once all symbols have been synchronized.
+        Raises:
+            RuntimeError: If at least one symbol failed to sync, once every symbol has been processed.
         """
 
-        if symbols is None:
-            symbols = await self.list_remote_symbols()
+        async with self._session_scope():
+            if symbols is None:
+                symbols = await self.list_remote_symbols()
+
+            if isinstance(symbols, str):
+                symbols = [symbols]
+
+            logger.info(f"Syncing {len(symbols)} symbols for {self.market_type.value}{self.data_type.value} with interval {self.interval.value if self.interval else 'N/A'}")
 
-        if isinstance(symbols, str):
-            symbols = [symbols]
+            symbol_semaphore = asyncio.Semaphore(self.SYMBOL_CONCURRENCY * 2)
 
-        logger.info(f"Syncing {len(symbols)} symbols for {self.market_type.value}{self.data_type.value} with interval {self.interval.value if self.interval else 'N/A'}")
+            failures = deque()
 
-        if self.progress:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[bold green]Completed {task.completed}/{task.total} symbols[/bold green]"),
-                BarColumn(),
-                TimeElapsedColumn(),
-                TimeRemainingColumn(),
-                console=LoggingConfigurator.get_console(),
-                transient=False
-            ) as progress:
+            async def sync_one(symbol: str, on_done=None):
+                try:
+                    async with symbol_semaphore:
+                        await self.sync_symbol(symbol)
+                except Exception as e:
+                    logger.error(f"{symbol}: sync failed: {e}")
+                    failures.append(symbol)
+                if on_done is not None:
+                    on_done()
+
+            console = LoggingConfigurator.get_console() or get_console()
+            # The progress bar only makes sense on a terminal, elsewhere (CI logs, pipes) it is just escape codes
+            use_progress = self.progress and console.is_terminal
+
+            if use_progress:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[bold green]Completed {task.completed}/{task.total} symbols[/bold green]"),
+                    BarColumn(),
+                    TimeElapsedColumn(),
+                    TimeRemainingColumn(),
+                    console=console,
+                    transient=False,
+                    auto_refresh=True,
+                    refresh_per_second=2
+                ) as progress:
                 
-                task = progress.add_task("Syncing symbols...", total=len(symbols))
-                for i in range(0, len(symbols), self.SYMBOL_CONCURRENCY * 2):
-                    batch = symbols[i:i + self.SYMBOL_CONCURRENCY * 2]
-                    await asyncio.gather(*(self.sync_symbol(s) for s in batch))
-                    progress.update(task, advance=len(batch))
-        else:
-            for i in range(0, len(symbols), self.SYMBOL_CONCURRENCY * 2):
-                batch = symbols[i:i + self.SYMBOL_CONCURRENCY * 2]
-                await asyncio.gather(*(self.sync_symbol(s) for s in batch))
+                    task = progress.add_task("Syncing symbols...", total=len(symbols))
+                    advance = lambda: progress.update(task, advance=1)
+                    await asyncio.gather(*(sync_one(s, advance) for s in symbols))
+            else:
+                done = 0
+                log_every = max(1, len(symbols) // 20)
+
+                def log_progress():
+                    nonlocal done
+                    done += 1
+                    if done % log_every == 0 or done == len(symbols):
+                        logger.info(f"Completed {done}/{len(symbols)} symbols")
+
+                await asyncio.gather(*(sync_one(s, log_progress) for s in symbols))
 
-            logger.info("Sync complete")
+            if failures:
+                failed = sorted(failures)
+                logger.warning(f"{len(failed)}/{len(symbols)} symbols failed to sync: {', '.join(failed[:10])}"
+                               f"{'...' if len(failed) > 10 else ''}")
+                raise RuntimeError(f"{len(failed)} of {len(symbols)} symbols failed to sync")
 
+            if not use_progress:
+                logger.info("Sync complete")
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import pandas as pd
 from datetime import datetime
 
-from binance_syncer.constant import MarketType, DataType, Frequency, KlineInterval, BASE_URL
+from binance_syncer.constant import MarketType, DataType, Frequency, KlineInterval, BASE_URL, KLINE_DATA_TYPES
 
 import logging
 
@@ -14,6 +14,22 @@ class BinancePathBuilder:
     data_type: DataType
     interval: KlineInterval = None
 
+    def __post_init__(self):
+        # Paths only vary by symbol/date: precompute the str.format templates once
+        self._is_klines = self.data_type in KLINE_DATA_TYPES
+        market, data = self.market_type.value, self.data_type.value
+        if self._is_klines and self.interval is None:
+            self._download_template = self._save_template = None
+        elif self._is_klines:
+            interval = self.interval.value
+            self._download_template = (
+                f"{BASE_URL}/data/{market}/{{frequency}}/{data}/{{symbol}}/{interval}/{{symbol}}-{interval}-{{date}}.zip"
+            )
+            self._save_template = f"{{prefix}}/data/{market}/{data}/{{symbol}}/{interval}"
+        else:
+            self._download_template = f"{BASE_URL}/data/{market}/{{frequency}}/{data}/{{symbol}}/{{symbol}}-{data}-{{date}}.zip"
+            self._save_template = f"{{prefix}}/data/{market}/{data}/{{symbol}}"
+
     def build_download_path(self, frequency: Frequency, symbol: str, year: str, month: str, day: str = None) -> str:
         month = int(month)
         year = int(year)
@@ -26,24 +42,13 @@ class BinancePathBuilder:
             assert 1 <= day <= 31, "Day must be between 1 and 31"
             date_part += f"-{day:02d}"
 
-        path_parts = [BASE_URL, "data", self.market_type.value, frequency.value, self.data_type.value]
-
-        if self.data_type in [DataType.KLINES, DataType.INDEX_PRICE_KLINES, DataType.MARK_PRICE_KLINES, DataType.PREMIUM_INDEX_KLINES]:
-            assert self.interval is not None, "Interval must be provided for Klines"
-            path_parts.append(symbol)
-            path_parts.append(self.interval.value)
-            filename = f"{symbol}-{self.interval.value}-{date_part}.zip"
-        else:
-            path_parts.append(symbol)
-            filename = f"{symbol}-{self.data_type.value}-{date_part}.zip"
-
-        path_parts.append(filename)
-        return "/".join(path_parts)
+        assert self._download_template is not None, "Interval must be provided for Klines"
+        return self._download_template.format(frequency=frequency.value, symbol=symbol, date=date_part)
     
     def build_listing_files_path(self, frequency: Frequency, symbol: str) -> str:
         path_parts = [BASE_URL, "?prefix=data", self.market_type.value, frequency.value, self.data_type.value]
         path_parts.append(symbol)
-        if self.data_type in [DataType.KLINES, DataType.INDEX_PRICE_KLINES, DataType.MARK_PRICE_KLINES, DataType.PREMIUM_INDEX_KLINES]:
+        if self.data_type in KLINE_DATA_TYPES:
             assert self.interval is not None, "Interval must be provided for Klines"
             path_parts.append(self.interval.value)
         return "/".join(path_parts)
@@ -53,23 +58,31 @@ class BinancePathBuilder:
         return "/".join(path_parts)
     
     def build_save_path(self, prefix: str, symbol: str, filename: str = None) -> str:
-        path_parts = [prefix, "data", self.market_type.value, self.data_type.value, symbol]
-        if self.data_type in [DataType.KLINES, DataType.INDEX_PRICE_KLINES, DataType.MARK_PRICE_KLINES, DataType.PREMIUM_INDEX_KLINES]:
-            assert self.interval is not None, "Interval must be provided for Klines"
-            path_parts.append(self.interval.value)
-        if filename:
-            path_parts.append(filename)
-        return "/".join(path_parts)
+        assert self._save_template is not None, "Interval must be provided for Klines"
+        path = self._save_template.format(prefix=prefix, symbol=symbol)
+        return f"{path}/{filename}" if filename else path
+
+def epoch_unit(value: int) -> str:
+    """
+    Guess the unit of an epoch timestamp from its magnitude (plausible dates: 2000 to next year + 1).
+    Parameters:
+        value (int): An epoch timestamp.
+    Returns:
+        str: "s", "ms", "us" or "ns".
+    """
+    low = datetime(2000, 1, 1).timestamp()
+    high = datetime(datetime.now().year + 2, 1, 1).timestamp()
+    for unit, scale in (("ms", 1e3), ("us", 1e6), ("ns", 1e9), ("s", 1)):
+        if low < value / scale < high:
+            return unit
+    logger.error(f"Impossible to guess the epoch unit of {value}")
+    raise ValueError(f"Cannot parse timestamp {value}")
 
 def safe_parse_time(series: pd.Series) -> pd.Series:
-    sample = series.iloc[0]
-    for unit in ["ms", "us", "ns"]:
-        try:
-            # Convert to numeric first to avoid FutureWarning
-            ts = pd.to_datetime(pd.to_numeric(sample, errors='coerce'), unit=unit)
-            if ts is not pd.NaT and 2000 < ts.year < datetime.now().year + 2:
-                return pd.to_datetime(pd.to_numeric(series, errors='coerce'), unit=unit)
-        except Exception:
-            continue
-    logger.error(f"Impossible to parse time for {series.name} with sample {sample}")
-    raise ValueError(f"Cannot parse timestamp {sample}")
\ No newline at end of file
+    # One numeric conversion, unit picked from the magnitude of the first valid value
+    nums = pd.to_numeric(series, errors='coerce')
+    first = nums.first_valid_index()
+    if first is None:
+        logger.error(f"Impossible to parse time for {series.name}: no numeric value")
+        raise ValueError(f"Cannot parse timestamp {series.iloc[0] if len(series) else None}")
+    return pd.to_datetime(nums, unit=epoch_unit(nums.loc[first]))
@@ -0,0 +1,149 @@
+import datetime as dt
+import os
+import tempfile
+import unittest
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from binance_syncer import Loader, MarketType, DataType, KlineInterval
+
+
+class LoaderManySymbolsTest(unittest.TestCase):
+    """A load over more symbols than DuckDB's expression depth limit (1000) must stay a single scan."""
+
+    N_SYMBOLS = 1100
+    N_DAYS = 5
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        start = dt.datetime(2024, 1, 1)
+        for i in range(cls.N_SYMBOLS):
+            symbol = f"S{i:04d}USDT"
+            path = os.path.join(cls.tmp.name, "data", "spot", "klines", symbol, "1d")
+            os.makedirs(path)
+            table = pa.table({
+                "open_time": pa.array([start + dt.timedelta(days=k) for k in range(cls.N_DAYS)], pa.timestamp("ns")),
+                # close encodes the symbol index, to check each row is tagged with its own file's symbol
+                "close": pa.array([float(i)] * cls.N_DAYS),
+            })
+            pq.write_table(table, os.path.join(path, f"{symbol}-1d-2024-01.parquet"))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def setUp(self):
+        self.loader = Loader(
+            MarketType.SPOT, DataType.KLINES, KlineInterval.D1, base_path=self.tmp.name, enable_cache=False
+        )
+
+    def test_load_all_symbols(self):
+        df = self.loader.load()
+        self.assertEqual(len(df), self.N_SYMBOLS * self.N_DAYS)
+        self.assertEqual(df["symbol"].nunique(), self.N_SYMBOLS)
+        self.assertNotIn("filename", df.columns)
+        expected = df["close"].map(lambda c: f"S{int(c):04d}USDT")
+        self.assertTrue((df["symbol"] == expected).all())
+
+    def test_load_symbols_with_time_filter_and_columns(self):
+        symbols = self.loader.available_symbols()[:1050]
+        df = self.loader.load(symbols, start="2024-01-04", select_cols=["close"])
+        self.assertEqual(list(df.columns), ["symbol", "close"])
+        self.assertEqual(len(df), 1050 * 2)
+        self.assertEqual(sorted(df["symbol"].unique()), symbols)
+
+    def test_load_single_symbol(self):
+        df = self.loader.load("S0042USDT")
+        self.assertEqual(df["symbol"].unique().tolist(), ["S0042USDT"])
+        self.assertEqual(len(df), self.N_DAYS)
+
+    def test_file_name_only_read_for_path_symbols(self):
+        symbol_globs = self.loader._build_globs(["S0001USDT", "S0002USDT"])
+        args = ("open_time", "timestamp", None, None, None)
+
+        sql = self.loader._build_sql(symbol_globs, False, *args)
+        self.assertIn("filename=true", sql)
+        self.assertNotIn("regexp", sql)
+
+        # The files carry the symbol, or it is a constant
+        self.assertNotIn("filename", self.loader._build_sql(symbol_globs, True, *args))
+        single = {"S0001USDT": symbol_globs["S0001USDT"]}
+        self.assertNotIn("filename", self.loader._build_sql(single, False, *args))
+
+
+class _FakeS3Client:
+    """In-memory list_objects_v2: records each paginate() call and each page served."""
+
+    PAGE_SIZE = 1000
+
+    def __init__(self, keys):
+        self.keys = sorted(keys)
+        self.paginate_calls = []
+        self.pages = 0
+
+    def get_paginator(self, name):
+        assert name == "list_objects_v2"
+        return self
+
+    def paginate(self, Bucket, Prefix="", StartAfter="", **kwargs):
+        self.paginate_calls.append(dict(kwargs, Prefix=Prefix, StartAfter=StartAfter))
+        keys = [k for k in self.keys if k.startswith(Prefix) and k > StartAfter]
+        for i in range(0, max(len(keys), 1), self.PAGE_SIZE):
+            self.pages += 1
+            yield {"Contents": [{"Key": k} for k in keys[i:i + self.PAGE_SIZE]]}
+
+    def list_objects_v2(self, **kwargs):
+        raise AssertionError("unexpected per-prefix listing")
+
+
+class LoaderS3ListingTest(unittest.TestCase):
+    """S3 files are found with a single listing of the data type prefix, whatever the number of symbols."""
+
+    N_SYMBOLS = 300
+
+    def setUp(self):
+        self.loader = Loader(MarketType.SPOT, DataType.KLINES, KlineInterval.D1)
+        base = self.loader._s3_base_prefix()
+        self.symbols = [f"S{i:04d}USDT" for i in range(self.N_SYMBOLS)]
+        keys = []
+        for symbol in self.symbols:
+            for interval in ("1d", "1h"):
+                keys += [f"{base}{symbol}/{interval}/2024-01-0{d}.parquet" for d in range(1, 4)]
+        self.client = _FakeS3Client(keys)
+        self.loader.s3 = True
+        self.loader.s3_client = self.client
+
+    def test_build_globs_lists_once(self):
+        globs_ = self.loader._build_globs(self.symbols)
+        self.assertEqual(len(self.client.paginate_calls), 1)
+        self.assertEqual(sorted(globs_), self.symbols)
+        urls = [u for us in globs_.values() for u in us]
+        self.assertEqual(len(urls), self.N_SYMBOLS * 3)
+        self.assertTrue(all("/1d/" in u for u in urls))
+
+        # Served from the cached listing
+        self.loader._build_globs(self.symbols[:10])
+        self.assertEqual(len(self.client.paginate_calls), 1)
+
+    def test_available_symbols_then_load_lists_once(self):
+        self.assertEqual(self.loader.available_symbols(), self.symbols)
+        globs_ = self.loader._build_globs(self.symbols)
+        self.assertEqual(len(self.client.paginate_calls), 1)
+        self.assertEqual(sorted(globs_), self.symbols)
+
+    def test_narrow_symbol_set_is_bounded(self):
+        self.client.PAGE_SIZE = 100
+        wanted = ["S0001USDT", "S0050USDT", "S0100USDT"]
+        globs_ = self.loader._build_globs(wanted)
+        self.assertEqual(sorted(globs_), wanted)
+        call, = self.client.paginate_calls
+        self.assertTrue(call["Prefix"].endswith("/S0"))
+        self.assertTrue(call["StartAfter"].endswith("/S0001USDT"))
+        # 100 symbols x 6 keys in range: the pages past the last symbol (of 18) are not requested
+        self.assertEqual(self.client.pages, 7)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import io
+import os
+import tempfile
+import unittest
+import zipfile
+from urllib.parse import quote
+
+from binance_syncer import Syncer, MarketType, DataType, Frequency, KlineInterval
+from binance_syncer.constant import BASE_URL
+
+
+S3_NS = "http://s3.amazonaws.com/doc/2006-03-01/"
+KLINE_ROW = "1704067200000,1,2,0.5,1.5,10,1704153599999,100,5,3,30,0\n"
+
+
+class _Response:
+    def __init__(self, body):
+        self.status = 200
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class _Session:
+    """Records the URLs requested and serves the same body for all of them."""
+
+    def __init__(self, body):
+        self.body = body
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        return _Response(self.body)
+
+
+class SyncerNonAsciiSymbolTest(unittest.TestCase):
+    """Symbols are not restricted to ASCII: the requested URLs must be percent-encoded."""
+
+    SYMBOL = "币安人生USDT"
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.syncer = Syncer(MarketType.FUTURES_UM, DataType.KLINES, KlineInterval.D1)
+        self.syncer.LOCAL_PREFIX = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def assertEncoded(self, url):
+        self.assertTrue(url.raw_path.isascii(), url.raw_path)
+        self.assertTrue(url.raw_query_string.isascii(), url.raw_query_string)
+        self.assertIn(quote(self.SYMBOL), str(url))
+
+    def test_listing_url(self):
+        xml = f'<ListBucketResult xmlns="{S3_NS}"><IsTruncated>false</IsTruncated></ListBucketResult>'.encode()
+        session = _Session(xml)
+        listing_url = self.syncer.path_builder.build_listing_files_path(Frequency.DAILY, self.SYMBOL) + "/"
+
+        body = asyncio.run(self.syncer._fetch_listing_page(session, listing_url, None))
+
+        self.assertEqual(body, xml)
+        url, = session.urls
+        self.assertEncoded(url)
+        self.assertEqual(url.query["prefix"], f"data/futures/um/daily/klines/{self.SYMBOL}/1d/")
+
+    def test_download_url(self):
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as z:
+            z.writestr("x.csv", KLINE_ROW)
+        session = _Session(archive.getvalue())
+        key = f"data/futures/um/daily/klines/{self.SYMBOL}/1d/{self.SYMBOL}-1d-2024-01-01.zip"
+
+        async def download():
+            # The semaphore is created in the running loop (Python < 3.10 binds it at creation)
+            return await self.syncer.download_and_store(
+                session, self.SYMBOL, f"{BASE_URL}/{key}", asyncio.Semaphore(1), max_retries=0
+            )
+
+        ok = asyncio.run(download())
+
+        self.assertTrue(ok)
+        url, = session.urls
+        self.assertEncoded(url)
+        self.assertEqual(url.path, "/" + BASE_URL.split("/", 3)[3] + "/" + key)
+        saved = self.syncer.path_builder.build_save_path(self.tmp.name, self.SYMBOL, "2024-01-01.parquet")
+        self.assertTrue(os.path.exists(saved))
+
+
+class SyncerLocalDeleteTest(unittest.TestCase):
+    """Only the files actually removed are reported as deleted."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.syncer = Syncer(MarketType.SPOT, DataType.KLINES, KlineInterval.D1)
+        self.syncer.LOCAL_PREFIX = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_files_are_not_logged(self):
+        path = self.syncer.path_builder.build_save_path(self.tmp.name, "BTCUSDT", "2024-01-01.parquet")
+        os.makedirs(os.path.dirname(path))
+        open(path, "wb").close()
+
+        with self.assertLogs("binance_syncer.syncer.core", level="INFO") as logs:
+            asyncio.run(self.syncer.delete_files_async(["2024-01-01", "2024-01-02"], "BTCUSDT"))
+
+        self.assertFalse(os.path.exists(path))
+        deleted = [r for r in logs.output if "Deleted" in r]
+        self.assertEqual(len(deleted), 1)
+        self.assertIn("2024-01-01.parquet", deleted[0])
+
+
+class PeekContinuationTokenTest(unittest.TestCase):
+    """The next page is prefetched from the token, wherever S3 puts it in the page."""
+
+    ENTRIES = "<Contents><Key>a</Key></Contents><CommonPrefixes><Prefix>b/</Prefix></CommonPrefixes>"
+
+    def peek(self, body):
+        return Syncer._peek_continuation_token(f'<ListBucketResult xmlns="{S3_NS}">{body}</ListBucketResult>'.encode())
+
+    def test_token_before_entries(self):
+        body = f"<IsTruncated>true</IsTruncated><NextContinuationToken>T</NextContinuationToken>{self.ENTRIES}"
+        self.assertEqual(self.peek(body), "T")
+
+    def test_token_after_entries(self):
+        self.assertEqual(self.peek(f"<IsTruncated>true</IsTruncated>{self.ENTRIES}<NextContinuationToken>T</NextContinuationToken>"), "T")
+        self.assertEqual(self.peek(f"{self.ENTRIES}<NextContinuationToken>T</NextContinuationToken><IsTruncated>true</IsTruncated>"), "T")
+
+    def test_last_page(self):
+        self.assertIsNone(self.peek(f"<IsTruncated>false</IsTruncated>{self.ENTRIES}"))
+        self.assertIsNone(self.peek(f"{self.ENTRIES}<IsTruncated>false</IsTruncated>"))
+
+
+if __name__ == "__main__":
+    unittest.main()